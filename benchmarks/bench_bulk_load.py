@@ -0,0 +1,70 @@
+"""
+Benchmark: temp file LOAD DATA INFILE vs streamed LOAD DATA LOCAL INFILE vs batched inserts.
+
+Usage:
+    python -m benchmarks.bench_bulk_load --scale 20 --batch-sizes 100 1000 5000 20000
+
+Needs the MySQL database configured in .env, with LOAD_DATA_INFILE_DIR set to the
+server's secure_file_priv directory for the "infile" mode and local_infile=ON on
+the server for the "stream" mode. The sales dataset is validated once and
+bulk-loaded into a scratch copy of the sales table (bench_sales) with each mode:
+
+- infile: to_csv into a unique file, LOAD DATA INFILE reads it back (former path)
+- stream: to_csv into a named pipe that the driver streams to the server
+- insert: executemany multi-row inserts, once per --batch-sizes value, to find
+  the throughput sweet spot for servers without LOAD DATA
+
+The scratch table is dropped at the end.
+"""
+import argparse
+import time
+from src.database.DataBase__singleton import MySQLConnector
+from src.factory.DataValidationFactory import DataValidationFactory
+from src.models.Sales import Sale
+from src.pipelines.DataIngestion import DataIngestion
+from .bench_loaders import build_dataset
+
+TABLE = "bench_sales"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[100, 1000, 5000, 20000])
+    args = parser.parse_args()
+
+    db = MySQLConnector()
+    pipeline = DataIngestion(model_class=Sale, loader_type="csv", database=db)
+    pipeline.db.ensure_schema(path=pipeline.generate_sql_path(script_name="create_tables.sql"))
+
+    data = DataValidationFactory.get_validation_class(
+        model="sales", data=build_dataset(args.scale), check_foreign_keys=False
+    ).validate(db=db)
+    print(f"\n{TABLE}: {len(data):,} validated rows")
+
+    db.execute(query=f"DROP TABLE IF EXISTS {TABLE};")
+    db.execute(query=f"CREATE TABLE {TABLE} LIKE sales;")
+    try:
+        runs = [("infile", "infile", None), ("stream", "stream", None)]
+        runs += [(f"insert/{batch_size}", "insert", batch_size) for batch_size in args.batch_sizes]
+
+        baseline = None
+        for name, mode, batch_size in runs:
+            pipeline.bulk_load_mode = mode
+            pipeline.insert_batch_size = batch_size or pipeline.insert_batch_size
+            best = float("inf")
+            for _ in range(args.repeat):
+                db.query_insert_delete_update_triggers_idxs(typeof="Truncate", query=f"TRUNCATE TABLE {TABLE};")
+                start = time.perf_counter()
+                pipeline._bulk_load(table_name=TABLE, data=data)
+                best = min(best, time.perf_counter() - start)
+            loaded = db.query_select(query=f"SELECT COUNT(*) FROM {TABLE};")[0][0]
+            baseline = baseline or best
+            print(f"{name:>12}: {best:8.3f}s  rows {loaded:,}  {loaded / best:12,.0f} rows/s  x{baseline / best:5.1f}")
+    finally:
+        db.execute(query=f"DROP TABLE IF EXISTS {TABLE};")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark: event loop responsiveness while an upload runs.
+
+Usage:
+    python -m benchmarks.bench_event_loop --model sales
+
+Needs the MySQL database configured in .env. The FastAPI app is served in
+process through httpx; while POST /pipeline/upload/{model}?wait=true runs, a probe requests
+GET /openapi.json every --interval seconds and records its latency. Two runs:
+
+- executor: the endpoint as shipped, with the pipeline in the upload executor
+- blocking: the pipeline called directly on the event loop (former behaviour)
+
+With the executor the probe latency stays around a few milliseconds; blocking,
+the probes wait for the whole upload.
+"""
+import argparse
+import asyncio
+import time
+import httpx
+from src.main import app
+from src.app.api import data_upload_controller
+
+
+async def probe(client: httpx.AsyncClient, stop: asyncio.Event, interval: float) -> list:
+    latencies = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        response = await client.get("/openapi.json")
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(interval)
+    return latencies
+
+
+async def run(model: str, interval: float, blocking: bool) -> tuple:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        stop = asyncio.Event()
+        probing = asyncio.create_task(probe(client, stop, interval))
+        await asyncio.sleep(interval)
+
+        start = time.perf_counter()
+        if blocking:
+            data_upload_controller._run_pipeline(data_upload_controller.MODEL_MAP[model])
+        else:
+            response = await client.post(f"/pipeline/upload/{model}", params={"wait": "true"})
+            response.raise_for_status()
+        upload_seconds = time.perf_counter() - start
+
+        stop.set()
+        latencies = sorted(await probing)
+    return upload_seconds, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model", default="sales")
+    parser.add_argument("--interval", type=float, default=0.02)
+    args = parser.parse_args()
+
+    for name, blocking in [("executor", False), ("blocking", True)]:
+        upload_seconds, latencies = asyncio.run(run(args.model, args.interval, blocking))
+        p50 = latencies[len(latencies) // 2]
+        print(
+            f"{name:>9}: upload {upload_seconds:7.2f}s  probes {len(latencies):5d}  "
+            f"p50 {p50 * 1000:8.1f} ms  max {latencies[-1] * 1000:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark: "already loaded" filtering modes against the size of the existing table.
+
+Usage:
+    python -m benchmarks.bench_existing_filter --sizes 10000 100000 1000000 --incoming 20000
+
+Needs the MySQL database configured in .env. A scratch table bench_existing_keys
+is filled with N keys (id and a name, like products and cities), then a batch of
+incoming rows, half of them already saved, is filtered with every mode:
+
+- pull:       SELECT the whole key column and isin in Python (former behaviour)
+- probe:      batched IN lookups, only the matches come back
+- temp_table: incoming keys staged in a temporary table and anti-joined in MySQL
+
+The scratch table is dropped at the end.
+"""
+import argparse
+import time
+import pandas as pd
+from src.database.DataBase__singleton import MySQLConnector
+from src.factory.concrete.validation.RuleBasedValidation import RuleBasedValidation
+
+TABLE = "bench_existing_keys"
+# "none" filters nothing, so it is no competitor
+MODES = ("pull", "probe", "temp_table")
+INSERT_BATCH = 50000
+
+
+def fill_table(db: MySQLConnector, size: int) -> None:
+    with db.connection() as connection:
+        db.execute(query=f"DROP TABLE IF EXISTS {TABLE};")
+        db.execute(query=f"CREATE TABLE {TABLE} (id BIGINT PRIMARY KEY, name VARCHAR(100), INDEX (name));")
+        for start in range(1, size + 1, INSERT_BATCH):
+            rows = [(key, f"name {key}") for key in range(start, min(start + INSERT_BATCH, size + 1))]
+            db.execute_many(query=f"INSERT INTO {TABLE} (id, name) VALUES (%s, %s);", rows=rows)
+        connection.commit()
+
+
+def incoming_frame(size: int, incoming: int) -> pd.DataFrame:
+    # first half already saved, second half new
+    keys = list(range(size - incoming // 2 + 1, size + incoming - incoming // 2 + 1))
+    return pd.DataFrame({
+        "Key": pd.array(keys, dtype="Int64"),
+        "Name": [f"name {key}" for key in keys]
+    })
+
+
+def spec_for(column: str, key: str, normalize: bool) -> dict:
+    return {
+        "model": "Bench",
+        "existing": {"table": TABLE, "key": key, "column": column, "normalize": normalize}
+    }
+
+
+def measure(db: MySQLConnector, spec: dict, data: pd.DataFrame, mode: str, repeat: int) -> tuple:
+    best = float("inf")
+    kept = 0
+    for _ in range(repeat):
+        validation = RuleBasedValidation(spec=dict(spec, expected_columns=[]), data=data.copy(), existing_filter=mode)
+        start = time.perf_counter()
+        validation._drop_existing(db=db)
+        best = min(best, time.perf_counter() - start)
+        kept = len(validation.data)
+    return best, kept
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--incoming", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    db = MySQLConnector()
+    db.connect()
+
+    try:
+        for size in args.sizes:
+            fill_table(db, size)
+            data = incoming_frame(size, args.incoming)
+            print(f"\n{TABLE}: {size:,} saved keys, {len(data):,} incoming rows")
+            for label, spec in [("id", spec_for("Key", "id", False)), ("name", spec_for("Name", "name", True))]:
+                baseline = None
+                for mode in MODES:
+                    seconds, kept = measure(db, spec, data, mode, args.repeat)
+                    baseline = baseline or seconds
+                    print(f"{label:>5} {mode:>10}: {seconds:8.3f}s  kept {kept:,}  x{baseline / seconds:5.1f}")
+    finally:
+        db.execute(query=f"DROP TABLE IF EXISTS {TABLE};")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: CSVLoader vs ParquetLoader / ArrowLoader on a scaled-up sales.csv.
+
+Usage:
+    python -m benchmarks.bench_loaders --scale 20
+
+The sales file is replicated `scale` times (with shifted SalesIDs), written as
+CSV, Parquet and Arrow IPC in a temporary directory, and each loader is timed
+reading it plus the numeric coercion the sales validation applies afterwards.
+"""
+import argparse
+import os
+import tempfile
+import time
+import pandas as pd
+from src.factory.DataLoaderFactory import DataLoaderFactory
+from src.factory.DataValidationFactory import DataValidationFactory
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+NUMERIC_COLUMNS = ["SalesPersonID", "CustomerID", "ProductID", "Quantity", "Discount", "TotalPrice"]
+
+
+def build_dataset(scale: int) -> pd.DataFrame:
+    sales = pd.read_csv(os.path.join(DATA_DIR, "sales.csv"))
+    step = int(sales["SalesID"].max()) + 1
+    frames = []
+    for i in range(scale):
+        frame = sales.copy()
+        frame["SalesID"] = frame["SalesID"] + i * step
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
+def coerce(data: pd.DataFrame) -> pd.DataFrame:
+    for column in NUMERIC_COLUMNS:
+        data[column] = pd.to_numeric(data[column], errors="coerce")
+    return data
+
+
+def timed(source: str, path: str, columns: list, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        loader = DataLoaderFactory.create_loader(source=source, filepath=path, columns=columns)
+        coerce(loader.load())
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    data = build_dataset(args.scale)
+    rows = len(data)
+    columns = list(DataValidationFactory.get_spec("sales")["expected_columns"])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {
+            "csv": os.path.join(tmp, "sales.csv"),
+            "parquet": os.path.join(tmp, "sales.parquet"),
+            "arrow": os.path.join(tmp, "sales.arrow"),
+        }
+        data.to_csv(paths["csv"], index=False)
+        data.to_parquet(paths["parquet"], index=False)
+        data.to_feather(paths["arrow"])
+        del data
+
+        results = {source: timed(source, path, columns, args.repeat) for source, path in paths.items()}
+
+        print(f"\nrows: {rows:,}")
+        for source, seconds in results.items():
+            size = os.path.getsize(paths[source]) / 1024 ** 2
+            print(f"{source:>8}: {seconds:8.3f}s  {size:8.1f} MB  x{results['csv'] / seconds:5.1f} vs csv")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark: parsing sales.csv with the model read schema vs today's double conversion.
+
+Usage:
+    python -m benchmarks.bench_read_schema --scale 20
+
+"untyped" reads the file letting pandas guess dtypes and then the sales
+validation re-coerces every numeric column. "schema" passes the read schema
+to the parser so the cleaning step finds the columns already typed; it is
+timed with the C and the pyarrow engines.
+"""
+import argparse
+import os
+import tempfile
+import time
+from typing import Optional
+from src.factory.DataLoaderFactory import DataLoaderFactory
+from src.factory.DataValidationFactory import DataValidationFactory
+from .bench_loaders import build_dataset
+
+
+def timed(path: str, schema: Optional[dict], engine: Optional[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        loader = DataLoaderFactory.create_loader(source="csv", filepath=path, schema=schema, engine=engine)
+        validation = DataValidationFactory.get_validation_class(model="sales", data=loader.load())
+        validation._clean_data()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    schema = DataValidationFactory.get_spec("sales")["read_schema"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sales.csv")
+        data = build_dataset(args.scale)
+        rows = len(data)
+        data.to_csv(path, index=False)
+        del data
+
+        results = {
+            "untyped (c)": timed(path, None, None, args.repeat),
+            "schema (c)": timed(path, schema, None, args.repeat),
+        }
+        try:
+            results["schema (pyarrow)"] = timed(path, schema, "pyarrow", args.repeat)
+        except ImportError:
+            print("pyarrow not installed, skipping the pyarrow engine")
+
+    print(f"\nrows: {rows:,}")
+    baseline = results["untyped (c)"]
+    for name, seconds in results.items():
+        print(f"{name:>18}: {seconds:8.3f}s  x{baseline / seconds:5.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark: scaling of the partitioned RuleBasedValidation cleaning with the worker count.
+
+Usage:
+    python -m benchmarks.bench_validation_workers --scale 20 --workers 1 2 4 8
+
+Cleans the employees (string heavy) and sales frames with 1..N worker processes
+and reports wall time, speedup over one worker and whether the result is
+identical to the serial one. The shared process pool starts on the first run
+of each worker count, so the best of --repeat runs is the steady state every
+chunk of an upload sees, pickling of the partitions included.
+"""
+import argparse
+import os
+import time
+from functools import partial
+import pandas as pd
+from src.factory.DataValidationFactory import DataValidationFactory
+from src.factory.abstract.DataValidation import DataValidation
+from src.factory.concrete.validation.RuleBasedValidation import _clean_partition
+from .bench_loaders import DATA_DIR, build_dataset
+
+
+def measure(model: str, data: pd.DataFrame, workers: int, repeat: int) -> tuple:
+    spec = DataValidationFactory.get_spec(model)
+    best = float("inf")
+    cleaned = None
+    for _ in range(repeat):
+        frame = data.copy()
+        start = time.perf_counter()
+        cleaned = DataValidation._apply_partitioned(data=frame, function=partial(_clean_partition, spec), workers=workers)
+        best = min(best, time.perf_counter() - start)
+    return best, cleaned
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=20)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    employees = pd.read_csv(os.path.join(DATA_DIR, "employees.csv"))
+    datasets = {
+        "employees": pd.concat([employees] * (args.scale * 2000), ignore_index=True),
+        "sales": build_dataset(args.scale),
+    }
+
+    print(f"cpu count: {os.cpu_count()}")
+    for model, data in datasets.items():
+        print(f"\n{model}: {len(data):,} rows")
+        baseline = serial = None
+        for workers in args.workers:
+            seconds, cleaned = measure(model, data, workers, args.repeat)
+            baseline = baseline or seconds
+            serial = cleaned if serial is None else serial
+            print(f"{workers:>3} workers: {seconds:8.3f}s  x{baseline / seconds:5.1f}  identical {cleaned.equals(serial)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -66,3 +66,19 @@ CREATE TABLE IF NOT EXISTS sales (
     sales_date VARCHAR(50) NOT NULL,
     transaction_number VARCHAR(50) NOT NULL
 );
+
+-- Índices de las claves con las que se descartan filas ya cargadas (EXISTING_FILTER);
+-- si ya existen, el error de nombre duplicado se ignora al aplicar el script
+CREATE INDEX idx_countries_country_name ON countries (country_name);
+CREATE INDEX idx_cities_city_name ON cities (city_name);
+CREATE INDEX idx_categories_category_name ON categories (category_name);
+
+-- Tabla: ingestion_watermarks (hasta dónde se cargó cada archivo en modo incremental)
+CREATE TABLE IF NOT EXISTS ingestion_watermarks (
+    table_name VARCHAR(64) PRIMARY KEY,
+    source VARCHAR(255) NOT NULL,
+    byte_offset BIGINT NOT NULL,
+    max_id BIGINT,
+    head_sha256 CHAR(64) NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
@@ -1,8 +1,8 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response, status
 from typing import Optional
 from .controller import DataUploadController
 from ..database.DataBase__singleton import MySQLConnector 
-from typing import Dict
+from typing import Any, Dict
 
 db_connector = MySQLConnector()
 data_upload_controller = DataUploadController(db_connector=db_connector)
@@ -11,9 +11,38 @@ router = APIRouter(
 )
 
 @router.post("/upload/{model_name}")
-async def upload_data_endpoint(model_name: Optional[str] = None) -> Dict[str, str]:
+async def upload_data_endpoint(response: Response, model_name: Optional[str] = None, wait: bool = False) -> Dict[str, Any]:
     """
     Endpoint to trigger data upload for a specific model or all models.
+    It enqueues a background job and answers 202 with its id; with wait=true
+    the request waits for the job and returns its result instead.
     """
-    return await data_upload_controller.upload_data(model_name=model_name)
-   
\ No newline at end of file
+    if wait:
+        return await data_upload_controller.submit_and_wait(model_name=model_name)
+
+    response.status_code = status.HTTP_202_ACCEPTED
+    return await data_upload_controller.submit_upload(model_name=model_name)
+
+
+@router.get("/jobs/{job_id}")
+async def job_status_endpoint(job_id: str) -> Dict[str, Any]:
+    """
+    Endpoint to get the stage, rows loaded, throughput and errors of an upload job.
+    """
+    return data_upload_controller.job_status(job_id=job_id)
+   
+
+@router.get("/count/{model_name}")
+async def count_rows_endpoint(model_name: str) -> Dict[str, Any]:
+    """
+    Endpoint to get the number of rows saved for a model.
+    """
+    return await data_upload_controller.count_rows(model_name=model_name)
+
+
+@router.get("/cache")
+async def cache_stats_endpoint() -> Dict[str, Any]:
+    """
+    Endpoint to get the query result cache counters.
+    """
+    return data_upload_controller.cache_stats()
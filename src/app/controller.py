@@ -6,10 +6,18 @@ from ..models.Employees import Employee
 from ..models.Sales import Sale 
 from ..models.Countries import Country
 from ..database.DataBase__singleton import MySQLConnector 
-from typing import Dict, Type, List, Optional
+from ..database.AsyncDataBase import AsyncMySQLConnector
+from ..database.QueryCache import QueryCache
+from typing import Any, Callable, Dict, Type, List, Optional
 from fastapi import HTTPException, status
 from ..pipelines.DataIngestion import DataIngestion
+from .jobs import UploadJobManager
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from graphlib import TopologicalSorter
+import asyncio
 import logging
+import os
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -27,44 +35,203 @@ class DataUploadController:
         "sales": Sale
     }
 
-    def __init__(self, db_connector: MySQLConnector):
+    # parents every model needs loaded first (their foreign keys point to them)
+    MODEL_DEPENDENCIES: Dict[str, List[str]] = {
+        "categories": [],
+        "countries": [],
+        "cities": ["countries"],
+        "products": ["categories"],
+        "customers": ["cities"],
+        "employees": ["cities"],
+        "sales": ["customers", "products", "employees"]
+    }
+
+    def __init__(self, db_connector: MySQLConnector, async_db_connector: Optional[AsyncMySQLConnector] = None):
         self.db_connector = db_connector
+        self.async_db_connector = async_db_connector or AsyncMySQLConnector()
+        # the pipelines block on pandas and mysql.connector, so they run here instead of on the event loop
+        self.executor = ThreadPoolExecutor(max_workers=int(os.getenv("UPLOAD_WORKERS", 3)), thread_name_prefix="upload")
+        self.jobs = UploadJobManager(
+            max_running=int(os.getenv("UPLOAD_JOBS_RUNNING", 1)),
+            max_queued=int(os.getenv("UPLOAD_JOBS_QUEUED", 8))
+        )
+
+    def _run_pipeline(self, model_class: Type, progress: Optional[Callable[[str, dict], None]] = None) -> dict:
+        """
+        Builds and runs the DataIngestion pipeline of a model. Blocking, meant for the executor.
+        """
+        data_ingestion_pipeline = DataIngestion(
+            model_class=model_class,
+            loader_type='csv',
+            database=self.db_connector,
+            progress=progress
+        )
+        return data_ingestion_pipeline.upload_data()
+
+    async def _upload_model(self, model_class: Type, progress: Optional[Callable[[str, dict], None]] = None) -> dict:
+        """
+        Runs a model pipeline in the upload executor, keeping the event loop free
+        to serve other requests while it parses, validates and loads.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self._run_pipeline, model_class, progress)
+
+    async def _upload_all(self, progress: Optional[Callable[[str, str, dict], None]] = None) -> Dict[str, Any]:
+        """
+        Uploads every model following MODEL_DEPENDENCIES: a model starts in the upload
+        executor as soon as all its parents are loaded, so independent models run
+        concurrently, each on its own pooled connection. When a model fails, the models
+        downstream of it are skipped and the rest keep going. `progress` gets the
+        model name, stage and stats of every model.
+
+        Returns:
+            The stats of the successful models and the names of the successful,
+            failed and skipped ones.
+        """
+        result: Dict[str, Any] = {"stats": {}, "successful": [], "failed": [], "skipped": []}
+        sorter = TopologicalSorter(self.MODEL_DEPENDENCIES)
+        sorter.prepare()
+        running: Dict[asyncio.Task, str] = {}
+
+        while sorter.is_active():
+            for name in sorter.get_ready():
+                blocked = [parent for parent in self.MODEL_DEPENDENCIES[name] if parent not in result["successful"]]
+                if blocked:
+                    logger.warning(f"Skipping model '{name}': {', '.join(blocked)} did not upload")
+                    result["skipped"].append(name)
+                    if progress is not None:
+                        progress(name, "skipped", {})
+                    sorter.done(name)
+                    continue
+                logger.info(f"Attempting to upload data for model: {name}")
+                model_progress = partial(progress, name) if progress is not None else None
+                running[asyncio.create_task(self._upload_model(self.MODEL_MAP[name], model_progress))] = name
 
-    async def upload_data(self, model_name: Optional[str] = None) -> Dict[str, str]:
+            if not running:
+                continue
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = running.pop(task)
+                try:
+                    result["stats"][name] = task.result()
+                    result["successful"].append(name)
+                    logger.info(f"Successfully uploaded data for model: {name}")
+                except Exception as e:
+                    logger.error(f"Error uploading data for model '{name}': {e}", exc_info=e)
+                    result["failed"].append(name)
+                    if progress is not None:
+                        progress(name, "failed", {"error": str(e)})
+                sorter.done(name)
+
+        return result
+
+    async def count_rows(self, model_name: str) -> Dict[str, Any]:
+        """
+        Returns the number of rows saved for a model, through the async database layer.
+
+        Raises:
+            HTTPException: If the model is not found.
+        """
+        if model_name.lower() not in self.MODEL_MAP:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Model '{model_name}' not found. Available models are: {', '.join(self.MODEL_MAP.keys())}"
+            )
+
+        rows = await self.async_db_connector.query_select(query=f"SELECT COUNT(*) FROM {model_name.lower()};")
+        return {"model": model_name.lower(), "rows": rows[0][0]}
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Returns the hit/miss counters and size of the query result cache.
+        """
+        return QueryCache().stats()
+
+    def _submit(self, model_name: str) -> tuple:
+        """
+        Enqueues the upload of a model (or "all") in the job manager, which dedupes it,
+        rejects overlapping uploads and enforces the queue limit.
+
+        Raises:
+            HTTPException: If the model is not found, an overlapping upload is in flight or the queue is full.
+        """
+        model_name = model_name.lower()
+        if model_name != "all" and model_name not in self.MODEL_MAP:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Model '{model_name}' not found. Available models are: {', '.join(self.MODEL_MAP.keys())}"
+            )
+
+        return self.jobs.submit(
+            model_name=model_name,
+            run=lambda job: self.upload_data(model_name=model_name, progress=job.progress)
+        )
+
+    async def submit_upload(self, model_name: str) -> Dict[str, Any]:
+        """
+        Enqueues the upload of a model (or "all") as a background job and returns its
+        id right away. If the model already has an upload in flight, that job is returned.
+
+        Raises:
+            HTTPException: If the model is not found, an overlapping upload is in flight or the queue is full.
+        """
+        job, created = self._submit(model_name=model_name)
+        message = "Upload enqueued." if created else "An upload of this model is already in flight."
+        return {"message": message, "job_id": job.job_id, "status_url": f"/pipeline/jobs/{job.job_id}"}
+
+    async def submit_and_wait(self, model_name: str) -> Dict[str, Any]:
+        """
+        Enqueues the upload like submit_upload, with the same admission control,
+        and waits for it to finish. If the model already has an upload in flight,
+        its result is awaited instead of starting another one.
+
+        Raises:
+            HTTPException: If the upload can't be enqueued or it fails.
+        """
+        job, _ = self._submit(model_name=model_name)
+        return await self.jobs.wait(job)
+
+    def job_status(self, job_id: str) -> Dict[str, Any]:
+        """
+        Returns the stage, rows loaded, throughput and errors of an upload job.
+
+        Raises:
+            HTTPException: If the job is not found.
+        """
+        return self.jobs.get(job_id).to_dict()
+
+    async def upload_data(
+        self,
+        model_name: Optional[str] = None,
+        progress: Optional[Callable[[str, str, dict], None]] = None
+    ) -> Dict[str, Any]:
         """
         Uploads data for a specified model type using the DataIngestion pipeline.
-        If no model name is specified, it attempts to upload data for all registered models.
+        If no model name is specified, it attempts to upload data for all registered models,
+        concurrently and in dependency order.
 
         Args:
             model_name: The name of the model to upload data for.
                         If None, all models will be processed.
+            progress: Optional callback getting the model name, stage and stats
+                      as every pipeline advances.
 
         Returns:
             A dictionary indicating the success or failure of the data upload,
-            including warnings for individual model failures.
+            including warnings for individual model failures and the stats
+            (rows loaded, chunks, peak memory) of every model run.
 
         Raises:
             HTTPException: If a specified model is not found or if all models fail to upload.
         """
-        failed_models: List[str] = []
-        successful_models: List[str] = []
-
         if model_name == "all":
             # Handle the case where no specific model name is provided (upload all)
-            for name, model_class in self.MODEL_MAP.items():
-                try:
-                    logger.info(f"Attempting to upload data for model: {name}")
-                    data_ingestion_pipeline = DataIngestion(
-                        model_class=model_class,
-                        loader_type='csv',  
-                        database=self.db_connector
-                    )
-                    data_ingestion_pipeline.upload_data()
-                    successful_models.append(name)
-                    logger.info(f"Successfully uploaded data for model: {name}")
-                except Exception as e:
-                    logger.error(f"Error uploading data for model '{name}': {e}", exc_info=True)
-                    failed_models.append(name)
+            result = await self._upload_all(progress=progress)
+            stats: Dict[str, dict] = result["stats"]
+            successful_models: List[str] = result["successful"]
+            failed_models: List[str] = result["failed"]
+            skipped_models: List[str] = result["skipped"]
 
             if not successful_models and failed_models:
                 # All models failed
@@ -76,11 +243,13 @@ class DataUploadController:
                 # Some models failed, but at least one succeeded
                 return {
                     "message": f"Data upload completed. Successfully processed models: {', '.join(successful_models)}.",
-                    "warning": f"The following models failed to upload data: {', '.join(failed_models)}. Please check server logs for details."
+                    "warning": f"The following models failed to upload data: {', '.join(failed_models)}. Please check server logs for details.",
+                    "skipped": skipped_models,
+                    "stats": stats
                 }
             else:
                 # All models succeeded
-                return {"message": "Data for all models uploaded successfully to the database."}
+                return {"message": "Data for all models uploaded successfully to the database.", "stats": stats}
         else:
             # Handle the case where a specific model name is provided
             target_model_class = self.MODEL_MAP.get(model_name.lower())
@@ -93,14 +262,10 @@ class DataUploadController:
 
             try:
                 logger.info(f"Attempting to upload data for specific model: {model_name}")
-                data_ingestion_pipeline = DataIngestion(
-                    model_class=target_model_class,
-                    loader_type='csv',
-                    database=self.db_connector
-                )
-                data_ingestion_pipeline.upload_data()
+                model_progress = partial(progress, model_name.lower()) if progress is not None else None
+                model_stats = await self._upload_model(target_model_class, model_progress)
                 logger.info(f"Successfully uploaded data for model: {model_name}")
-                return {"message": f"Data for {model_name} was uploaded successfully to the database."}
+                return {"message": f"Data for {model_name} was uploaded successfully to the database.", "stats": model_stats}
             except Exception as e:
                 logger.error(f"Error uploading data for {model_name}: {e}", exc_info=True)
                 raise HTTPException(
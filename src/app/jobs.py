@@ -0,0 +1,207 @@
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from fastapi import HTTPException, status
+from uuid import uuid4
+import asyncio
+import copy
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class UploadJob:
+    """
+    State of a background upload, updated by the DataIngestion progress callbacks
+    from the executor threads and read by the status endpoint.
+    """
+
+    def __init__(self, model_name: str):
+        self.job_id: str = uuid4().hex
+        self.model_name: str = model_name
+        self.status: str = "queued"
+        self.stage: str = "queued"
+        self.models: Dict[str, dict] = {}
+        self.errors: List[str] = []
+        self.result: Optional[Dict[str, Any]] = None
+        self.exception: Optional[Exception] = None
+        self.created_at: float = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        return self.status in ("queued", "running")
+
+    def progress(self, model: str, stage: str, stats: dict) -> None:
+        """
+        Progress callback of a model pipeline: records its stage and rows loaded so far.
+        Called from the executor threads, so the job state is updated under a lock.
+        """
+        with self._lock:
+            self.stage = stage if self.model_name != "all" else f"{model}: {stage}"
+            self.models[model] = {"stage": stage, "rows_loaded": stats.get("rows_loaded", 0)}
+            if stats.get("error"):
+                self.errors.append(f"{model}: {stats['error']}")
+
+    def update(self, **state) -> None:
+        """
+        Sets job attributes (status, stage, result, timestamps) under the lock.
+        """
+        with self._lock:
+            for name, value in state.items():
+                setattr(self, name, value)
+
+    def add_error(self, error: str) -> None:
+        with self._lock:
+            self.errors.append(error)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns a snapshot of the job, taken under the lock so the executor
+        threads can keep reporting progress while it is serialized.
+        """
+        with self._lock:
+            models = copy.deepcopy(self.models)
+            errors = list(self.errors)
+            status, stage, result = self.status, self.stage, self.result
+            started_at, finished_at = self.started_at, self.finished_at
+
+        rows = sum(model["rows_loaded"] for model in models.values())
+        elapsed = ((finished_at or time.time()) - started_at) if started_at else 0.0
+        return {
+            "job_id": self.job_id,
+            "model": self.model_name,
+            "status": status,
+            "stage": stage,
+            "rows_loaded": rows,
+            "rows_per_second": round(rows / elapsed, 1) if elapsed else 0.0,
+            "elapsed_seconds": round(elapsed, 3),
+            "models": models,
+            "errors": errors,
+            "result": result
+        }
+
+
+class UploadJobManager:
+    """
+    Runs uploads as background jobs: at most `max_running` at a time, with up to
+    `max_queued` jobs queued or running before new ones are rejected with 429.
+    A request for a model that already has a job in flight gets that job back
+    instead of starting a duplicate load; "all" and a single model overlapping
+    are rejected with 409, since neither job covers the other.
+    Finished jobs are kept for the status endpoint, the last `history` of them.
+    """
+
+    def __init__(self, max_running: int = 1, max_queued: int = 8, history: int = 100):
+        self.max_running = max_running
+        self.max_queued = max_queued
+        self.history = history
+        self.jobs: "OrderedDict[str, UploadJob]" = OrderedDict()
+        self._slots = asyncio.Semaphore(max_running)
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def _in_flight(self, model_name: str) -> Optional[UploadJob]:
+        for job in self.jobs.values():
+            if job.active and job.model_name == model_name:
+                return job
+        return None
+
+    def _overlapping(self, model_name: str) -> Optional[UploadJob]:
+        for job in self.jobs.values():
+            if job.active and job.model_name != model_name and "all" in (job.model_name, model_name):
+                return job
+        return None
+
+    def submit(self, model_name: str, run: Callable[[UploadJob], Awaitable[Dict[str, Any]]]) -> tuple:
+        """
+        Enqueues `run` as a job for a model, or returns the job already in flight for it.
+
+        Returns:
+            The job and whether it was created by this call.
+
+        Raises:
+            HTTPException: If an overlapping upload is in flight or the queue is full.
+        """
+        job = self._in_flight(model_name)
+        if job is not None:
+            return job, False
+
+        overlapping = self._overlapping(model_name)
+        if overlapping is not None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Upload job {overlapping.job_id} ({overlapping.model_name}) overlaps '{model_name}'. "
+                       "Please retry when it finishes."
+            )
+
+        if sum(job.active for job in self.jobs.values()) >= self.max_queued:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=f"Upload queue is full ({self.max_queued} jobs). Please retry later."
+            )
+
+        job = UploadJob(model_name=model_name)
+        self.jobs[job.job_id] = job
+        self._prune()
+        task = asyncio.create_task(self._run(job, run))
+        self._tasks[job.job_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.job_id, None))
+        return job, True
+
+    async def wait(self, job: UploadJob) -> Dict[str, Any]:
+        """
+        Waits for a job to finish and returns its result. The job is shielded,
+        so a client that disconnects while waiting doesn't cancel the upload.
+
+        Raises:
+            HTTPException: The error of the upload if it failed (500 unless it raised an HTTPException).
+        """
+        task = self._tasks.get(job.job_id)
+        if task is not None:
+            await asyncio.shield(task)
+
+        if job.status == "failed":
+            if isinstance(job.exception, HTTPException):
+                raise job.exception
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Upload job {job.job_id} ({job.model_name}) failed: {'; '.join(job.errors)}"
+            )
+        return job.result
+
+    async def _run(self, job: UploadJob, run: Callable[[UploadJob], Awaitable[Dict[str, Any]]]) -> None:
+        async with self._slots:
+            job.update(status="running", stage="running", started_at=time.time())
+            try:
+                result = await run(job)
+                job.update(status="succeeded", stage="succeeded", result=result)
+            except Exception as e:
+                logger.error(f"Upload job {job.job_id} ({job.model_name}) failed: {e}")
+                job.add_error(str(e.detail) if isinstance(e, HTTPException) else str(e))
+                job.update(status="failed", stage="failed", exception=e)
+            finally:
+                job.update(finished_at=time.time())
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self.jobs.items() if not job.active]
+        for job_id in finished[:max(0, len(finished) - self.history)]:
+            del self.jobs[job_id]
+
+    def get(self, job_id: str) -> UploadJob:
+        """
+        Raises:
+            HTTPException: If the job is not found.
+        """
+        job = self.jobs.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Job '{job_id}' not found.")
+        return job
+
+    async def shutdown(self) -> None:
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,64 @@
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from dotenv import load_dotenv
+from typing import Optional, Sequence
+import os
+load_dotenv()
+
+
+class AsyncMySQLConnector:
+    '''
+        Async counterpart of MySQLConnector for the query paths of the API.
+        It runs on an async SQLAlchemy engine over aiomysql, so awaiting a query
+        releases the event loop instead of blocking the uvicorn worker.
+        The bulk loads keep using the pooled MySQLConnector in a thread
+    '''
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(AsyncMySQLConnector, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self.config = {
+            "host": os.getenv("DB_HOST"),
+            "user": os.getenv("DB_USER"),
+            "password": os.getenv("DB_PASS"),
+            "database": os.getenv("DB_DATABASE"),
+            "port": os.getenv('DB_PORT')
+        }
+        self.pool_size: int = int(os.getenv("DB_POOL_SIZE", 5))
+        self.engine: Optional[AsyncEngine] = None
+        self._initialized = True
+
+    def connect(self) -> None:
+        if self.engine is None:
+            try:
+                self.engine = create_async_engine(
+                    f"mysql+aiomysql://{self.config['user']}:{self.config['password']}@"
+                    f"{self.config['host']}:{self.config['port']}/{self.config['database']}",
+                    pool_size=self.pool_size,
+                    max_overflow=0,
+                    pool_pre_ping=True
+                )
+            except ImportError as err:
+                raise ImportError("The async database layer requires aiomysql: pip install aiomysql") from err
+
+    async def query_select(self, query: str, params: Optional[Sequence] = None) -> list:
+        '''
+            This method runs a raw query with the driver's %s placeholders
+            and returns its rows as tuples, like MySQLConnector.query_select
+        '''
+        self.connect()
+        async with self.engine.connect() as connection:
+            result = await connection.exec_driver_sql(query, tuple(params) if params else None)
+            return [tuple(row) for row in result.fetchall()]
+
+    async def dispose(self) -> None:
+        if self.engine is not None:
+            await self.engine.dispose()
+            self.engine = None
@@ -1,10 +1,87 @@
-from mysql.connector import connect
+from mysql.connector.pooling import MySQLConnectionPool
+from mysql.connector import errorcode
 import pandas as pd
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import NullPool
+from .QueryCache import QueryCache
+from ..monitoring.Metrics import MetricsRegistry
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
+from typing import Iterator, Optional, Sequence
+from uuid import uuid4
+import hashlib
+import inspect
+import tempfile
+import threading
+import time
 import os
 load_dotenv()
 
+DB_CALL_SECONDS = MetricsRegistry().histogram(
+    "db_call_duration_seconds", "Duration of the MySQLConnector calls", ["method"]
+)
+DB_CALL_ROWS = MetricsRegistry().counter(
+    "db_call_rows_total", "Rows returned or sent by the MySQLConnector calls", ["method"]
+)
+DB_CALL_ERRORS = MetricsRegistry().counter(
+    "db_call_errors_total", "MySQLConnector calls that raised", ["method"]
+)
+
+
+def instrumented(method):
+    '''
+        Decorator that records the duration, rows and errors of a connector call.
+        Rows are the ones returned (a list or DataFrame) or, for the bulk loads,
+        the ones of the `data` frame sent, passed by keyword or by position.
+        A returned generator (chunked query_alchemy) is wrapped, so the duration
+        and rows are those of its consumption, recorded once it ends or is closed
+    '''
+    signature = inspect.signature(method)
+    name = method.__name__
+
+    def count(sized) -> None:
+        if isinstance(sized, (list, pd.DataFrame)):
+            DB_CALL_ROWS.inc(len(sized), method=name)
+
+    def consume(generator: Iterator, elapsed: float) -> Iterator:
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    item = next(generator)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed += time.perf_counter() - start
+                count(item)
+                yield item
+        except Exception:
+            DB_CALL_ERRORS.inc(method=name)
+            raise
+        finally:
+            generator.close()
+            DB_CALL_SECONDS.observe(elapsed, method=name)
+
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = method(*args, **kwargs)
+        except Exception:
+            DB_CALL_ERRORS.inc(method=name)
+            DB_CALL_SECONDS.observe(time.perf_counter() - start, method=name)
+            raise
+
+        if inspect.isgenerator(result):
+            return consume(result, time.perf_counter() - start)
+
+        DB_CALL_SECONDS.observe(time.perf_counter() - start, method=name)
+        count(result if isinstance(result, (list, pd.DataFrame)) else signature.bind(*args, **kwargs).arguments.get("data"))
+        return result
+    return wrapper
+
 
 class MySQLConnector:
     _instance = None
@@ -14,11 +91,11 @@ class MySQLConnector:
             cls._instance =super(MySQLConnector, cls).__new__(cls)
             cls._instance._initialized = False
         return cls._instance
-    
+
     def __init__(self):
         if self._initialized:
             return
-        
+
         self.config = {
             "host": os.getenv("DB_HOST"),
             "user": os.getenv("DB_USER"),
@@ -26,79 +103,489 @@ class MySQLConnector:
             "database": os.getenv("DB_DATABASE"),
             "port": os.getenv('DB_PORT')
         }
-        self.connection = None
-        self.cursor = None
+        self.pool_size: int = int(os.getenv("DB_POOL_SIZE", 5))
+        self.pool_timeout: float = float(os.getenv("DB_POOL_TIMEOUT", 30))
+        # LOAD DATA LOCAL INFILE may only read the streams this process creates in here
+        self.local_infile_dir: str = os.getenv("LOAD_DATA_LOCAL_DIR") or os.path.join(tempfile.gettempdir(), "henry_pi_local_infile")
+        self.pool = None
         self.engine = None
+        self.statement_cache_size: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", 64))
+        self._statements: OrderedDict = OrderedDict()
+        self._statements_lock = threading.Lock()
+        self.query_cache = QueryCache()
+        self._applied_schemas: set = set()
+        self._schema_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.pool_size)
+        self._local = threading.local()
+        self._pool_lock = threading.Lock()
         self._initialized = True
-    
+
     def connect(self):
-        if self.connection is None:
+        with self._pool_lock:
+            if self.pool is None:
+                try:
+                    os.makedirs(self.local_infile_dir, mode=0o700, exist_ok=True)
+                    self.pool = MySQLConnectionPool(
+                        pool_name="henry_pi_pool",
+                        pool_size=self.pool_size,
+                        allow_local_infile_in_path=self.local_infile_dir,
+                        # resetting the session on checkout would deallocate the cached prepared statements
+                        pool_reset_session=False,
+                        **self.config
+                    )
+                    # one engine for the whole process, drawing its connections from the driver
+                    # pool so DB_POOL_SIZE caps every connection the process opens
+                    self.engine = create_engine(
+                        "mysql+mysqlconnector://",
+                        creator=self._engine_connection,
+                        poolclass=NullPool
+                    )
+                    event.listen(self.engine, "close", self._release_engine_connection)
+
+                    print(f"Database {self.config['database']} connection pool of {self.pool_size} was made successfully")
+
+                except Exception as err:
+                    print(f"Error trying to connect to database: {err}")
+                    raise
+
+    @contextmanager
+    def _checkout(self) -> Iterator:
+        '''
+            This method takes a connection from the pool, waiting up to DB_POOL_TIMEOUT
+            seconds when it is exhausted, and gives it back when the block ends.
+            The session isn't reset on return (it would drop the cached prepared
+            statements), so whatever transaction the block left open, reads included,
+            is rolled back here; otherwise it would keep its snapshot and metadata locks
+        '''
+        if self.pool is None:
+            raise Exception("Database not connected")
+
+        if not self._slots.acquire(timeout=self.pool_timeout):
+            raise TimeoutError(f"No database connection available after {self.pool_timeout} seconds")
+
+        try:
+            connection = self.pool.get_connection()
             try:
-                self.connection = connect(**self.config)
-                self.cursor = self.connection.cursor()
-                self.engine = create_engine(
-                    f"mysql+mysqlconnector://{self.config['user']}:{self.config['password']}@"
-                    f"{self.config['host']}:{self.config['port']}/{self.config['database']}"
-                )
+                yield connection
+            finally:
+                try:
+                    connection.rollback()
+                except Exception as e:
+                    print(f"Error rolling back pooled connection: {e}")
+                finally:
+                    connection.close()
+        finally:
+            self._slots.release()
 
-                print(f"Database {self.config['database']} connection was made successfully")
+    def _engine_connection(self):
+        '''
+            This method is the creator of the SQLAlchemy engine: it takes a slot and a
+            connection from the driver pool, like _checkout. The engine doesn't pool them
+            itself, closing one gives it back to the driver pool and frees its slot
+        '''
+        if not self._slots.acquire(timeout=self.pool_timeout):
+            raise TimeoutError(f"No database connection available after {self.pool_timeout} seconds")
+
+        try:
+            return self.pool.get_connection()
+        except Exception:
+            self._slots.release()
+            raise
 
-            except Exception as err:
-                print(f"Error trying to connect to database: {err}")
-                raise 
-    
-    def query_select(self, query: str):
-        if self.cursor is None:
+    def _release_engine_connection(self, dbapi_connection, connection_record) -> None:
+        self._slots.release()
+
+    @contextmanager
+    def connection(self) -> Iterator:
+        '''
+            This method hands out a pooled connection for the duration of a with block.
+            Nested calls in the same thread reuse the connection already held, so
+            session objects like temporary tables survive across several queries
+        '''
+        if self.pool is None:
             raise Exception("Database not connected")
 
-        self.cursor.execute(query)
-        return self.cursor.fetchall()
+        held = getattr(self._local, "connection", None)
+        if held is not None:
+            yield held
+            return
+
+        with self._checkout() as connection:
+            self._local.connection = connection
+            try:
+                yield connection
+            finally:
+                self._local.connection = None
+
+    @instrumented
+    def query_select(self, query: str, params: Optional[Sequence] = None):
+        with self.connection() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query, params)
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+
+    def _stream(self, query: str, params: Optional[Sequence], batch_size: int) -> Iterator[tuple]:
+        '''
+            This method runs a query on an unbuffered cursor and yields its column
+            names with each batch of rows, read from the server as they are needed.
+            The connection is not shared with the thread, since it can't run other
+            queries until the result is read; leaving early discards the rest
+        '''
+        with self._checkout() as connection:
+            cursor = connection.cursor(buffered=False)
+            try:
+                cursor.execute(query, params)
+                columns = [column[0] for column in cursor.description]
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield columns, rows
+            finally:
+                if connection.unread_result:
+                    connection.consume_results()
+                cursor.close()
+
+    def stream_select(self, query: str, params: Optional[Sequence] = None, batch_size: int = 10000) -> Iterator[list]:
+        '''
+            This method is the streaming query_select: it yields the rows in lists
+            of up to batch_size, so a full table scan runs in constant memory
+        '''
+        for _, rows in self._stream(query, params, batch_size):
+            yield rows
+
+    @instrumented
+    def execute(self, query: str, params: Optional[Sequence] = None) -> None:
+        '''
+            This method runs a statement without a result set and without committing,
+            used for session objects such as temporary tables
+        '''
+        with self.connection() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query, params)
+            finally:
+                cursor.close()
+
+    @instrumented
+    def execute_many(self, query: str, rows: Sequence) -> None:
+        '''
+            This method runs a parametrized statement for every row, batched by
+            the driver into multi-row inserts
+        '''
+        with self.connection() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.executemany(query, rows)
+            finally:
+                cursor.close()
+
+    def _prepared_cursor(self, connection, query: str):
+        '''
+            This method returns the prepared cursor of a statement on a connection,
+            preparing it only the first time. Cursors are kept per (connection, SQL)
+            in an LRU of DB_STATEMENT_CACHE_SIZE entries per pooled connection
+        '''
+        key = (connection.connection_id, query)
+        with self._statements_lock:
+            cursor = self._statements.get(key)
+            if cursor is not None:
+                self._statements.move_to_end(key)
+                return cursor
+
+        cursor = connection.cursor(prepared=True)
+        evicted = []
+        with self._statements_lock:
+            self._statements[key] = cursor
+            while len(self._statements) > self.statement_cache_size * self.pool_size:
+                evicted.append(self._statements.popitem(last=False)[1])
+
+        for stale in evicted:
+            try:
+                stale.close()
+            except Exception:
+                pass
+        return cursor
+
+    @instrumented
+    def query_prepared(self, query: str, params: Optional[Sequence] = None) -> list:
+        '''
+            This method runs a parametrized statement, such as the (sql, params)
+            of CRUDQueryBuilder, as a server-side prepared statement. The statement
+            is parsed once per connection and later calls with other values only
+            send the new params. Returns the rows, or commits when there are none
+        '''
+        with self.connection() as connection:
+            cursor = self._prepared_cursor(connection, query)
+            try:
+                cursor.execute(query, tuple(params or ()))
+                if cursor.with_rows:
+                    return cursor.fetchall()
+                connection.commit()
+                self.query_cache.invalidate_statement(query)
+                return []
+            except Exception:
+                connection.rollback()
+                # a failed statement may leave its cursor unusable, so it is prepared again next time
+                with self._statements_lock:
+                    self._statements.pop((connection.connection_id, query), None)
+                raise
+
+    @instrumented
+    def query_alchemy(self, query: str, params: Optional[Sequence] = None, chunksize: Optional[int] = None):
+        '''
+            This method returns the result of a query as a DataFrame or, with a
+            chunksize, as an iterator of DataFrames of up to chunksize rows read
+            from an unbuffered cursor. The SQLAlchemy mysqlconnector dialect has no
+            server-side cursors (stream_results would still buffer everything), so
+            the chunks come from the pooled driver connection instead of the engine.
+            Whole results go through the QueryCache, chunked ones are never cached
+        '''
+        if chunksize:
+            return self._stream_frames(query, params, chunksize)
 
-    def query_alchemy(self, query: str) -> pd.DataFrame:
         if self.engine is None:
             raise Exception("Database engine not initialized")
-    
-        return pd.read_sql_query(query, self.engine)
-    
+
+        return self.query_cache.get_or_load(
+            query,
+            params,
+            lambda: pd.read_sql_query(query, self.engine, params=tuple(params) if params is not None else None)
+        )
+
+    def _stream_frames(self, query: str, params: Optional[Sequence], chunksize: int) -> Iterator[pd.DataFrame]:
+        for columns, rows in self._stream(query, params, chunksize):
+            yield pd.DataFrame.from_records(rows, columns=columns)
+
+    @instrumented
     def query_insert_delete_update_triggers_idxs(self, typeof: str, query: str):
-        if self.cursor is None:
-            raise Exception("Database not connected")
-        
+        with self.connection() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query)
+                connection.commit()
+                self.query_cache.invalidate_statement(query)
+                print(f"{typeof} creado exitosamente")
+            except Exception as e:
+                connection.rollback()
+                print(f"Error executing query: {e}")
+                raise
+            finally:
+                cursor.close()
+
+    @staticmethod
+    def _load_data_sql(file_name: str, table: str, columns: Sequence, local: bool = False) -> str:
+        return f"""
+            LOAD DATA {'LOCAL ' if local else ''}INFILE '{file_name}'
+            INTO TABLE {table}
+            FIELDS TERMINATED BY ','
+            ENCLOSED BY '"'
+            LINES TERMINATED BY '\n'
+            IGNORE 1 ROWS
+            ({', '.join(columns)});
+        """
+
+    def _run_load(self, sql: str, table: str, strict: bool = False) -> None:
+        with self.connection() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(sql)
+                connection.commit()
+                print(f"Data uploaded successfully into '{table}'.")
+
+            except Exception as e:
+                connection.rollback()
+                print(f"ERROR uploading data to table '{table}': {e}")
+                if strict:
+                    raise
+            finally:
+                cursor.close()
+
+    @instrumented
+    def load_data_infile(self, temp_file_name: str, table: str, data: pd.DataFrame, strict: bool = False):
+        self._run_load(sql=self._load_data_sql(temp_file_name, table, data.columns), table=table, strict=strict)
+
+    @staticmethod
+    def _to_rows(data: pd.DataFrame) -> list:
+        '''
+            This method converts a DataFrame to plain tuples in one pass, with
+            nulls as None and datetimes as Python datetimes the driver can bind
+        '''
+        frame = data.astype(object)
+        for column in data.select_dtypes(include=["datetime", "datetimetz"]).columns:
+            frame[column] = pd.Series(pd.DatetimeIndex(data[column]).to_pydatetime(), index=data.index, dtype=object)
+        frame = frame.where(data.notna(), None)
+        return list(frame.itertuples(index=False, name=None))
+
+    @instrumented
+    def insert_many(self, table: str, data: pd.DataFrame, batch_size: int = 1000, strict: bool = False) -> None:
+        '''
+            This method inserts a DataFrame with parametrized batched inserts, for
+            servers where LOAD DATA is not allowed. Every batch of `batch_size` rows
+            goes through executemany, which the driver sends as one multi-row
+            INSERT ... VALUES (...), (...); the whole frame is a single transaction
+        '''
+        rows = self._to_rows(data)
+        sql = f"INSERT INTO {table} ({', '.join(data.columns)}) VALUES ({', '.join(['%s'] * len(data.columns))})"
+
+        with self.connection() as connection:
+            cursor = connection.cursor()
+            try:
+                for start in range(0, len(rows), batch_size):
+                    cursor.executemany(sql, rows[start:start + batch_size])
+                connection.commit()
+                print(f"Data inserted successfully into '{table}'.")
+
+            except Exception as e:
+                connection.rollback()
+                print(f"ERROR inserting data into table '{table}': {e}")
+                if strict:
+                    raise
+            finally:
+                cursor.close()
+
+    @staticmethod
+    def _write_stream(path: str, data: pd.DataFrame) -> None:
         try:
-            self.cursor.execute(query)
-            self.connection.commit()
-            print(f"{typeof} creado exitosamente")
-        except Exception as e:
-            self.connection.rollback()
-            print(f"Error executing query: {e}")
-            raise
-    
-    def load_data_infile(self, temp_file_name: str, table: str, data: pd.DataFrame):
-        if self.cursor is None:
-            raise Exception("Database not connected")
-        
+            data.to_csv(path, index=False, encoding='utf-8', lineterminator='\n')
+        except OSError:
+            # the server stopped reading (the load failed), nothing left to stream
+            pass
+
+    @staticmethod
+    def _release_stream(path: str) -> None:
+        '''
+            This method opens the read end of a FIFO without blocking, so a writer
+            still waiting for a reader (the load never started) fails and returns
+        '''
+        try:
+            os.close(os.open(path, os.O_RDONLY | os.O_NONBLOCK))
+        except OSError:
+            pass
+
+    @instrumented
+    def load_data_local_infile(self, table: str, data: pd.DataFrame, strict: bool = False) -> None:
+        '''
+            This method bulk-loads a DataFrame with LOAD DATA LOCAL INFILE without
+            a CSV on disk: the frame is serialized by a writer thread into a named
+            pipe that the driver streams to the server as it reads it. Where named
+            pipes don't exist (Windows) a uniquely named temp file is used instead
+        '''
+        path = os.path.join(self.local_infile_dir, f"{table}_{uuid4().hex}.csv")
+        writer = None
+        if hasattr(os, "mkfifo"):
+            os.mkfifo(path, 0o600)
+            writer = threading.Thread(target=self._write_stream, args=(path, data), daemon=True)
+            writer.start()
+        else:
+            data.to_csv(path, index=False, encoding='utf-8', lineterminator='\n')
+
+        try:
+            self._run_load(
+                sql=self._load_data_sql(path.replace("\\", "/"), table, data.columns, local=True),
+                table=table,
+                strict=strict
+            )
+        finally:
+            # the writer may not have opened the pipe yet, so release it until it returns
+            while writer is not None and writer.is_alive():
+                self._release_stream(path)
+                writer.join(timeout=0.1)
+            os.remove(path)
+
+    def _run_statements(self, *queries: str) -> None:
+        with self.connection() as connection:
+            cursor = connection.cursor()
+            try:
+                for query in queries:
+                    cursor.execute(query)
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                cursor.close()
+
+    @instrumented
+    def create_staging_table(self, table: str) -> str:
+        '''
+            This method creates an empty, uniquely named copy of a table (same
+            columns, keys and indexes) to bulk-load into, and returns its name
+        '''
+        staging = f"{table}__staging_{uuid4().hex[:8]}"
+        self._run_statements(f"CREATE TABLE {staging} LIKE {table};")
+        return staging
+
+    @instrumented
+    def drop_table(self, table: str) -> None:
+        self._run_statements(f"DROP TABLE IF EXISTS {table};")
+
+    @instrumented
+    def swap_table(self, table: str, staging: str) -> None:
+        '''
+            This method replaces a table with its loaded staging copy. Both renames
+            happen in a single atomic RENAME TABLE, so readers see either the old
+            rows or the new ones, never a half-loaded table
+        '''
+        old = f"{table}__old_{uuid4().hex[:8]}"
         try:
-            sql = f"""
-                LOAD DATA INFILE '{temp_file_name}'
-                INTO TABLE {table}
-                FIELDS TERMINATED BY ',' 
-                ENCLOSED BY '"'
-                LINES TERMINATED BY '\n'
-                IGNORE 1 ROWS
-                ({', '.join(data.columns)});
-            """
-            self.cursor.execute(sql)
-            self.connection.commit()
-            print(f"Data uploaded successfully into '{table}'.")
-
-        except Exception as e:
-            self.connection.rollback()
-            print(f"ERROR uploading data to table '{table}': {e}")
-    
-    def create_tables_from_sql_file(self, path: str) -> None: 
+            self._run_statements(f"RENAME TABLE {table} TO {old}, {staging} TO {table};")
+        finally:
+            self.query_cache.invalidate(table=table)
+        self.drop_table(table=old)
+        print(f"Table '{table}' refreshed successfully.")
+
+    @instrumented
+    def merge_table(self, table: str, staging: str, columns: Sequence) -> None:
+        '''
+            This method merges a loaded staging copy into its table with one
+            set-based INSERT ... SELECT ... ON DUPLICATE KEY UPDATE: new keys are
+            inserted and saved keys get the staged values, in a single transaction
+        '''
+        column_list = ", ".join(columns)
+        updates = ", ".join(f"{column} = staged.{column}" for column in columns)
+        try:
+            self._run_statements(
+                f"INSERT INTO {table} ({column_list}) "
+                f"SELECT * FROM (SELECT {column_list} FROM {staging}) AS staged "
+                f"ON DUPLICATE KEY UPDATE {updates};"
+            )
+        finally:
+            self.query_cache.invalidate(table=table)
+        print(f"Data merged successfully into '{table}'.")
+
+    @instrumented
+    def get_watermark(self, table: str) -> Optional[dict]:
+        '''
+            This method returns the high-water mark of the last incremental load
+            of a table (source file, byte offset, max id, head hash), if any
+        '''
+        rows = self.query_select(
+            query="SELECT source, byte_offset, max_id, head_sha256 FROM ingestion_watermarks WHERE table_name = %s;",
+            params=(table,)
+        )
+        if not rows:
+            return None
+        source, byte_offset, max_id, head_sha256 = rows[0]
+        return {"source": source, "byte_offset": byte_offset, "max_id": max_id, "head_sha256": head_sha256}
+
+    @instrumented
+    def save_watermark(self, table: str, source: str, byte_offset: int, max_id: Optional[int], head_sha256: str) -> None:
+        self.query_prepared(
+            query="INSERT INTO ingestion_watermarks (table_name, source, byte_offset, max_id, head_sha256) "
+                  "VALUES (%s, %s, %s, %s, %s) ON DUPLICATE KEY UPDATE source = VALUES(source), "
+                  "byte_offset = VALUES(byte_offset), max_id = VALUES(max_id), head_sha256 = VALUES(head_sha256);",
+            params=(table, source, byte_offset, max_id, head_sha256)
+        )
+
+    @instrumented
+    def create_tables_from_sql_file(self, path: str) -> bool:
         '''
             This method creates all the tables in the database selected
-            if didnt exists any of them
+            if didnt exists any of them, and their indexes. Returns whether every statement succeeded
         '''
 
         if not os.path.exists(path):
@@ -109,16 +596,68 @@ class MySQLConnector:
 
         statements = [stmt.strip() for stmt in sql_script.split(';') if stmt.strip()]
 
-        for statement in statements:
-            try:
-                self.cursor.execute(statement)
-            
-            except Exception as e:
-                print(f"Error al ejecutar la sentencia:\n{statement}\nError: {e}")
+        succeeded = True
+        with self.connection() as connection:
+            cursor = connection.cursor()
+            for statement in statements:
+                try:
+                    cursor.execute(statement)
+
+                except Exception as e:
+                    if getattr(e, "errno", None) == errorcode.ER_DUP_KEYNAME:
+                        # CREATE INDEX has no IF NOT EXISTS in MySQL, an index already there is applied
+                        continue
+                    succeeded = False
+                    print(f"Error al ejecutar la sentencia:\n{statement}\nError: {e}")
+
+            cursor.close()
+            connection.commit()
+
+        if succeeded:
+            print("All tables were successfully created")
+        return succeeded
+
+    @instrumented
+    def ensure_schema(self, path: str) -> None:
+        '''
+            This method runs a DDL script only when it is new or has changed.
+            The sha256 of the file is compared with the one recorded in the
+            schema_versions table, and once applied or verified it is kept in
+            memory, so later calls in the process don't touch the database.
+            If any statement fails the script is not recorded and it raises,
+            so the next call runs it again
+        '''
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"SQL file not found: {path}")
+
+        with open(path, 'rb') as file:
+            digest = hashlib.sha256(file.read()).hexdigest()
 
-        self.connection.commit()
-        print("All tables were successfully created")
-    
+        if digest in self._applied_schemas:
+            return
+
+        script = os.path.basename(path)
+        with self._schema_lock:
+            if digest in self._applied_schemas:
+                return
+
+            with self.connection() as connection:
+                self.execute(
+                    query="CREATE TABLE IF NOT EXISTS schema_versions ("
+                          "script VARCHAR(255) PRIMARY KEY, "
+                          "sha256 CHAR(64) NOT NULL, "
+                          "applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP);"
+                )
+                saved = self.query_select(query="SELECT sha256 FROM schema_versions WHERE script = %s;", params=(script,))
 
-    
+                if not saved or saved[0][0] != digest:
+                    if not self.create_tables_from_sql_file(path=path):
+                        raise Exception(f"ERROR: Schema script '{script}' failed, it will be retried on the next run")
+                    self.execute(
+                        query="INSERT INTO schema_versions (script, sha256) VALUES (%s, %s) "
+                              "ON DUPLICATE KEY UPDATE sha256 = VALUES(sha256);",
+                        params=(script, digest)
+                    )
+                    connection.commit()
 
+            self._applied_schemas.add(digest)
@@ -0,0 +1,66 @@
+import threading
+import numpy as np
+import pandas as pd
+from .DataBase__singleton import MySQLConnector
+
+
+class KeyIndexCache:
+    '''
+        Process-wide cache of the key columns referenced by foreign keys.
+        Every (table, column) is read once into a unique pd.Index, so checking
+        millions of child rows is a single vectorized isin against it instead of
+        a query per row. Entries are dropped when their table is reloaded
+    '''
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super(KeyIndexCache, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self._indexes: dict = {}
+        self._lock = threading.Lock()
+        self._initialized = True
+
+    def get_keys(self, db: MySQLConnector, table: str, column: str) -> pd.Index:
+        '''
+            This method returns the saved keys of table.column, reading them
+            from the database only on the first call after an invalidation.
+            The keys are streamed in batches, so no full list of rows is built
+        '''
+        with self._lock:
+            if (table, column) not in self._indexes:
+                batches = [
+                    pd.Index([row[0] for row in rows]).unique()
+                    for rows in db.stream_select(query=f"SELECT {column} FROM {table};")
+                ]
+                keys = batches[0].append(batches[1:]).unique() if batches else pd.Index([])
+                self._indexes[(table, column)] = keys
+            return self._indexes[(table, column)]
+
+    def contains(self, db: MySQLConnector, table: str, column: str, values: pd.Series) -> np.ndarray:
+        '''
+            This method returns a boolean mask telling which values exist in table.column.
+            Null values are reported as existing, missing values are dropna's job
+        '''
+        keys = self.get_keys(db=db, table=table, column=column)
+        return (values.isin(keys) | values.isna()).to_numpy()
+
+    def invalidate(self, table: str) -> None:
+        '''
+            This method drops the cached keys of a table, called after it is reloaded
+        '''
+        with self._lock:
+            for key in [key for key in self._indexes if key[0] == table]:
+                del self._indexes[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._indexes.clear()
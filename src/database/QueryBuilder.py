@@ -1,19 +1,39 @@
+import re
+
+
+IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)?$")
+AGGREGATE = re.compile(
+    r"^(?:[A-Za-z_][A-Za-z0-9_]*\(\s*(?:DISTINCT\s+)?(?:\*|[A-Za-z_][A-Za-z0-9_.]*)\s*\)|[A-Za-z_][A-Za-z0-9_.]*)"
+    r"(?:\s+AS\s+[A-Za-z_][A-Za-z0-9_]*)?$",
+    re.IGNORECASE
+)
+OPERATORS = {"=", "!=", "<>", "<", "<=", ">", ">=", "LIKE", "NOT LIKE", "IN", "NOT IN", "BETWEEN", "IS", "IS NOT"}
+
+
 class CRUDQueryBuilder:
+    '''
+        Builds parametrized CRUD statements: values never go into the SQL text,
+        they are returned apart as params for the driver's %s placeholders.
+        The same query shape always gives the same SQL, so the server can reuse
+        its prepared statement with different values. Table, column and
+        aggregate names are validated, since they can't be parameters
+    '''
 
     def __init__(
-        self, 
-        table: str, 
-        query_type: str = "READ", 
-        filters: list = [], 
+        self,
+        table: str,
+        query_type: str = "READ",
+        filters: list = [],
         values: dict = {},
         aggregates: list = []
     ):
-        self.table = table
+        self.table = self._identifier(table)
         self.query_type = query_type.upper()
-        self.filters = filters  
-        self.values = values    
+        self.filters = filters
+        self.values = values
         self.aggregates = aggregates
         self.query = ""
+        self.params: list = []
 
         if self.query_type == "READ":
             self.build_select()
@@ -26,16 +46,54 @@ class CRUDQueryBuilder:
         else:
             raise ValueError("ERROR: Query type not supported")
 
+    @staticmethod
+    def _identifier(name: str) -> str:
+        if not isinstance(name, str) or not IDENTIFIER.match(name):
+            raise ValueError(f"ERROR: Invalid identifier: {name!r}")
+        return name
+
+    @staticmethod
+    def _aggregate(expression: str) -> str:
+        if not isinstance(expression, str) or not AGGREGATE.match(expression.strip()):
+            raise ValueError(f"ERROR: Invalid aggregate expression: {expression!r}")
+        return expression.strip()
+
+    def build_condition(self, col: str, op: str, val) -> str:
+        col = self._identifier(col)
+        op = " ".join(str(op).upper().split())
+        if op not in OPERATORS:
+            raise ValueError(f"ERROR: Operator not supported: {op}")
+
+        if op == "BETWEEN":
+            if not isinstance(val, (list, tuple)) or len(val) != 2:
+                raise ValueError("ERROR: BETWEEN requires a (low, high) tuple")
+            self.params.extend(val)
+            return f"{col} BETWEEN %s AND %s"
+
+        if op in ("IN", "NOT IN"):
+            if not isinstance(val, (list, tuple, set)) or not val:
+                raise ValueError(f"ERROR: {op} requires a non-empty list of values")
+            self.params.extend(val)
+            return f"{col} {op} ({', '.join(['%s'] * len(val))})"
+
+        if op in ("IS", "IS NOT"):
+            if val is not None:
+                raise ValueError(f"ERROR: {op} only supports None (NULL)")
+            return f"{col} {op} NULL"
+
+        self.params.append(val)
+        return f"{col} {op} %s"
+
     def build_where_clause(self):
         if not self.filters:
             return ""
-        
-        conditions = [f"{col} {op} {repr(val) if isinstance(val, str) else val}" for col, op, val in self.filters]
+
+        conditions = [self.build_condition(col, op, val) for col, op, val in self.filters]
         return " WHERE " + " AND ".join(conditions)
 
     def build_select(self):
         if self.aggregates:
-            select_clause = ", ".join(self.aggregates)
+            select_clause = ", ".join(self._aggregate(aggregate) for aggregate in self.aggregates)
         else:
             select_clause = "*"
         self.query = f"SELECT {select_clause} FROM {self.table}" + self.build_where_clause() + ";"
@@ -43,22 +101,40 @@ class CRUDQueryBuilder:
     def build_insert(self):
         if not self.values:
             raise ValueError("INSERT operation requires values.")
-        
-        columns = ", ".join(self.values.keys())
-        vals = ", ".join([repr(val) if isinstance(val, str) else str(val) for val in self.values.values()])
-        self.query = f"INSERT INTO {self.table} ({columns}) VALUES ({vals});"
+
+        columns = ", ".join(self._identifier(col) for col in self.values.keys())
+        self.params.extend(self.values.values())
+        self.query = f"INSERT INTO {self.table} ({columns}) VALUES ({', '.join(['%s'] * len(self.values))});"
 
     def build_update(self):
         if not self.values:
             raise ValueError("UPDATE operation requires values.")
-        
-        set_clause = ", ".join(
-            [f"{col} = {repr(val) if isinstance(val, str) else val}" for col, val in self.values.items()]
-        )
+
+        set_clause = ", ".join([f"{self._identifier(col)} = %s" for col in self.values.keys()])
+        self.params.extend(self.values.values())
         self.query = f"UPDATE {self.table} SET {set_clause}" + self.build_where_clause() + ";"
 
     def build_delete(self):
         self.query = f"DELETE FROM {self.table}" + self.build_where_clause() + ";"
 
     def get_query(self):
+        '''
+            This method returns the SQL alone, only for statements without values.
+            It used to inline the values, so rather than hand out SQL whose %s
+            placeholders would be run without them it raises and points to get_statement
+        '''
+        if self.params:
+            raise ValueError(
+                "ERROR: This query has parameters, use get_statement() and run it "
+                "with its params, e.g. db.query_prepared(*builder.get_statement())"
+            )
         return self.query
+
+    def get_params(self) -> tuple:
+        return tuple(self.params)
+
+    def get_statement(self) -> tuple:
+        '''
+            This method returns the (sql, params) pair to execute
+        '''
+        return self.query, self.get_params()
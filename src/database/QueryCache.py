@@ -0,0 +1,156 @@
+from collections import OrderedDict
+from typing import Callable, Iterable, Optional, Sequence
+import os
+import re
+import threading
+import time
+import pandas as pd
+
+
+QUOTED = re.compile(r"('(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|`[^`]*`)")
+TABLE_REFERENCE = re.compile(r"\b(?:FROM|JOIN)\s+`?([A-Za-z_][A-Za-z0-9_]*)`?", re.IGNORECASE)
+WRITE_TARGET = re.compile(r"^\s*(?:INSERT\s+(?:IGNORE\s+)?INTO|REPLACE\s+INTO|UPDATE|DELETE\s+FROM)\s+`?([A-Za-z_][A-Za-z0-9_]*)`?", re.IGNORECASE)
+ALL_TABLES = "*"
+
+
+class QueryCache:
+    '''
+        Process-wide read-through cache of query results, in front of
+        MySQLConnector.query_alchemy. Entries are keyed by the normalized SQL and
+        its params, evicted by LRU, TTL and a total byte cap, and invalidated per
+        table when it is loaded. A query that reads a name the cache doesn't know
+        as a table (a view, a CTE) depends on every table
+    '''
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super(QueryCache, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self.max_entries: int = int(os.getenv("QUERY_CACHE_SIZE", 128))
+        self.ttl: float = float(os.getenv("QUERY_CACHE_TTL", 300))
+        self.max_bytes: int = int(float(os.getenv("QUERY_CACHE_MB", 256)) * 1024 ** 2)
+        self.tables: set = set()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.invalidations: int = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._bytes: int = 0
+        self._writes: int = 0
+        self._lock = threading.Lock()
+        self._initialized = True
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        '''
+            This method collapses whitespace and drops the trailing semicolon
+            outside of quoted literals, so formatting doesn't split cache entries
+        '''
+        parts = QUOTED.split(query.strip().rstrip(";").strip())
+        return "".join(part if index % 2 else " ".join(part.split()) for index, part in enumerate(parts))
+
+    def register_tables(self, tables: Iterable[str]) -> None:
+        with self._lock:
+            self.tables.update(table.lower() for table in tables)
+
+    def dependencies(self, query: str) -> frozenset:
+        '''
+            This method returns the tables a query reads, or every table when it
+            reads a name that isn't a registered table
+        '''
+        text = "".join(part for index, part in enumerate(QUOTED.split(query)) if index % 2 == 0)
+        names = {name.lower() for name in TABLE_REFERENCE.findall(text)}
+        if not names or not names <= self.tables:
+            return frozenset([ALL_TABLES])
+        return frozenset(names)
+
+    def get_or_load(self, query: str, params: Optional[Sequence], load: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        '''
+            This method returns a copy of the cached result of a query, running
+            `load` on a miss. A result is not stored if its tables were invalidated
+            while it was loading, or if it is bigger than the byte cap
+        '''
+        if self.max_entries <= 0:
+            return load()
+
+        key = (self.normalize(query), tuple(params) if params is not None else ())
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry["expires"] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry["data"].copy()
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            writes = self._writes
+
+        data = load()
+        size = int(data.memory_usage(deep=True).sum())
+        with self._lock:
+            if writes == self._writes and size <= self.max_bytes:
+                if key in self._entries:
+                    self._remove(key)
+                self._entries[key] = {
+                    "data": data.copy(),
+                    "size": size,
+                    "tables": self.dependencies(query),
+                    "expires": time.monotonic() + self.ttl
+                }
+                self._bytes += size
+                while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                    self._remove(next(iter(self._entries)))
+                    self.evictions += 1
+        return data
+
+    def _remove(self, key: tuple) -> None:
+        self._bytes -= self._entries.pop(key)["size"]
+
+    def invalidate(self, table: Optional[str] = None) -> None:
+        '''
+            This method drops the cached results that depend on a table, or every
+            result when no table is given
+        '''
+        with self._lock:
+            self._writes += 1
+            self.invalidations += 1
+            stale = [
+                key for key, entry in self._entries.items()
+                if table is None or ALL_TABLES in entry["tables"] or table.lower() in entry["tables"]
+            ]
+            for key in stale:
+                self._remove(key)
+
+    def invalidate_statement(self, query: str) -> None:
+        '''
+            This method invalidates the table a write statement targets, or every
+            result for statements it can't attribute to one table (DDL, triggers)
+        '''
+        match = WRITE_TARGET.match(query)
+        self.invalidate(table=match.group(1) if match else None)
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations
+            }
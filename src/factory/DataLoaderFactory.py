@@ -1,11 +1,26 @@
-from .concrete.loader import CSVLoader, JSONLoader
+from .concrete.loader import CSVLoader, JSONLoader, NDJSONLoader, ParquetLoader, ArrowLoader
+from typing import List, Optional
 
 class DataLoaderFactory:
-    def create_loader(source: str, filepath: str):
+    def create_loader(
+        source: str,
+        filepath: str,
+        chunksize: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+        schema: Optional[dict] = None,
+        engine: Optional[str] = None,
+        workers: int = 1
+    ):
         if source == "csv":
-            return CSVLoader.CSVLoader(filepath=filepath)
+            return CSVLoader.CSVLoader(filepath=filepath, chunksize=chunksize, schema=schema, engine=engine, workers=workers)
         elif source == "json":
-            return JSONLoader.JSONLoader(filepath=filepath)
+            return JSONLoader.JSONLoader(filepath=filepath, schema=schema)
+        elif source == "ndjson":
+            return NDJSONLoader.NDJSONLoader(filepath=filepath, chunksize=chunksize, schema=schema)
+        elif source == "parquet":
+            return ParquetLoader.ParquetLoader(filepath=filepath, columns=columns, chunksize=chunksize)
+        elif source == "arrow":
+            return ArrowLoader.ArrowLoader(filepath=filepath, columns=columns, chunksize=chunksize)
         else:
             raise ValueError("Source not supported")
-    
\ No newline at end of file
+    
@@ -1,23 +1,31 @@
-from .concrete.validation import CategoryValidation, CityValidation, EmployeeValidation, ProductValidation, CountryValidation, CustomerValidation, SalesValidation
+from .concrete.validation.RuleBasedValidation import RuleBasedValidation
+from .abstract.DataValidation import SeenIds
+from .concrete.validation.ValidationSpecs import VALIDATION_SPECS
 import pandas as pd
+from typing import Optional
 
 
 class DataValidationFactory:
+
+    def get_spec(model: str) -> dict:
+        if model not in VALIDATION_SPECS:
+            raise ValueError("Model not supported")
+        return VALIDATION_SPECS[model]
     
-    def get_validation_class(model: str, data: pd.DataFrame):
-        if model == "categories":
-            return CategoryValidation.CategoryValidation(data=data)
-        elif model == "cities":
-            return CityValidation.CityValidation(data=data)
-        elif model == "employees":
-            return EmployeeValidation.EmployeeValidation(data=data)
-        elif model == "products":
-            return ProductValidation.ProductValidation(data=data)
-        elif model == "countries":
-            return CountryValidation.CountryValidation(data=data)
-        elif model == "customers":
-            return CustomerValidation.CustomerValidation(data=data)
-        elif model == "sales":
-            return SalesValidation.SaleValidation(data=data)
-        else:
-            raise ValueError("Model not supported")
\ No newline at end of file
+    def get_validation_class(
+        model: str,
+        data: pd.DataFrame,
+        seen_ids: Optional[SeenIds] = None,
+        check_foreign_keys: bool = True,
+        existing_filter: str = "probe",
+        workers: int = 1
+    ):
+        spec = DataValidationFactory.get_spec(model)
+        return RuleBasedValidation(
+            spec=spec,
+            data=data,
+            seen_ids=seen_ids,
+            check_foreign_keys=check_foreign_keys,
+            existing_filter=existing_filter,
+            workers=workers
+        )
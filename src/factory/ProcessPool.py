@@ -0,0 +1,84 @@
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+import atexit
+import multiprocessing
+import os
+import threading
+
+
+class ProcessPool:
+    """
+    Process-wide pool shared by the CSV byte-range parsing and the partitioned
+    validation. It is started once and reused by every chunk, instead of a new
+    pool per call. Its workers come from a forkserver (spawn where there is none),
+    never forked from the upload threads, since forking a multithreaded process
+    can deadlock. The functions sent to it must be module level so they pickle,
+    and scripts using it need an `if __name__ == "__main__"` guard.
+    It starts with max(CSV_WORKERS, VALIDATION_WORKERS) processes, so both stages
+    normally share a single executor for the life of the process.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super(ProcessPool, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        self.context = multiprocessing.get_context(start_method)
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.workers: int = 0
+        self.min_workers: int = max(int(os.getenv("CSV_WORKERS", 1)), int(os.getenv("VALIDATION_WORKERS", 1)))
+        self._holders: Dict[ProcessPoolExecutor, int] = {}
+        self._lock = threading.Lock()
+        atexit.register(self.shutdown)
+        self._initialized = True
+
+    @contextmanager
+    def lease(self, workers: int) -> Iterator[ProcessPoolExecutor]:
+        """
+        Holds the shared executor, with at least `workers` processes, for the duration
+        of a with block. A larger request starts a new executor for the next callers;
+        the previous one keeps accepting work from the blocks still holding it and is
+        shut down when the last of them ends.
+        """
+        with self._lock:
+            if self.executor is None or workers > self.workers:
+                previous = self.executor
+                self.workers = max(workers, self.min_workers)
+                self.executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=self.context)
+                self._holders[self.executor] = 0
+                if previous is not None:
+                    self._retire(previous)
+            executor = self.executor
+            self._holders[executor] += 1
+
+        try:
+            yield executor
+        finally:
+            with self._lock:
+                if executor in self._holders:
+                    self._holders[executor] -= 1
+                    if executor is not self.executor:
+                        self._retire(executor)
+
+    def _retire(self, executor: ProcessPoolExecutor) -> None:
+        if self._holders[executor] == 0:
+            del self._holders[executor]
+            executor.shutdown(wait=False)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            for executor in self._holders:
+                executor.shutdown(wait=False, cancel_futures=True)
+            self._holders.clear()
+            self.executor = None
+            self.workers = 0
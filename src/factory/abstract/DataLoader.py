@@ -1,6 +1,55 @@
 from abc import ABC, abstractmethod
+from typing import Iterator, Optional
+import os
+import pandas as pd
 
 class DataLoader(ABC):
+    COMPRESSION_EXTENSIONS: dict = {
+        ".gz": "gzip",
+        ".bz2": "bz2",
+        ".xz": "xz",
+        ".zst": "zstd",
+        ".zip": "zip"
+    }
+    COMPRESSION_MAGIC_BYTES: dict = {
+        b"\x1f\x8b": "gzip",
+        b"BZh": "bz2",
+        b"\xfd7zXZ\x00": "xz",
+        b"\x28\xb5\x2f\xfd": "zstd",
+        b"PK\x03\x04": "zip"
+    }
+
     @abstractmethod
     def load(self):
-        pass
\ No newline at end of file
+        pass
+
+    def load_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Yields the data as a sequence of DataFrames.
+        Loaders without a streaming implementation yield the whole file once.
+        """
+        yield self.load()
+
+    def sample(self, nrows: int) -> pd.DataFrame:
+        """
+        Returns the first `nrows` rows, used to estimate the in-memory size of a row.
+        """
+        return next(iter(self.load_chunks())).head(nrows)
+
+    @staticmethod
+    def detect_compression(filepath: str) -> Optional[str]:
+        """
+        Returns the pandas compression name for the file, detected by its extension
+        or, failing that, by its magic bytes. None for uncompressed files.
+        """
+        extension = os.path.splitext(filepath)[1].lower()
+        if extension in DataLoader.COMPRESSION_EXTENSIONS:
+            return DataLoader.COMPRESSION_EXTENSIONS[extension]
+
+        with open(filepath, "rb") as file:
+            head = file.read(8)
+        for magic, compression in DataLoader.COMPRESSION_MAGIC_BYTES.items():
+            # bz2 streams are "BZh" followed by the block size digit
+            if head.startswith(magic) and (compression != "bz2" or head[3:4].isdigit()):
+                return compression
+        return None
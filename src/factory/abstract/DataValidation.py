@@ -1,8 +1,50 @@
 from abc import ABC, abstractmethod
+from typing import Callable, List, Optional
+import numpy as np
 import pandas as pd
+from ..ProcessPool import ProcessPool
+
+
+class SeenIds:
+    """
+    IDs of the chunks already validated, 8 bytes per ID where a Python set of ints
+    takes ~70. They are kept as sorted int64 runs: every chunk adds a run, and runs
+    of similar size are merged, so each ID is re-sorted O(log n) times and a lookup
+    probes O(log n) runs instead of re-sorting every ID seen on every chunk.
+    """
+
+    def __init__(self):
+        self.runs: List[np.ndarray] = []
+
+    def isin(self, values: np.ndarray) -> np.ndarray:
+        # sorted needles walk each run in order, which keeps the binary searches in cache
+        order = np.argsort(values, kind="stable")
+        needles = values[order]
+        found_sorted = np.zeros(len(values), dtype=bool)
+        for run in self.runs:
+            positions = np.searchsorted(run, needles)
+            inside = positions < len(run)
+            inside[inside] = run[positions[inside]] == needles[inside]
+            found_sorted |= inside
+
+        found = np.empty(len(values), dtype=bool)
+        found[order] = found_sorted
+        return found
+
+    def update(self, values: np.ndarray) -> None:
+        self.runs.append(np.unique(values.astype(np.int64, copy=False)))
+        while len(self.runs) > 1 and len(self.runs[-2]) <= len(self.runs[-1]):
+            last = self.runs.pop()
+            self.runs[-1] = np.union1d(self.runs[-1], last)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(run.nbytes for run in self.runs)
 
 
 class DataValidation(ABC):
+    MIN_PARTITION_ROWS: int = 50000
+
     @abstractmethod
     def validate(self):
         pass
@@ -16,16 +58,79 @@ class DataValidation(ABC):
             raise ValueError(f"ERROR: {model} DataFrame must have exactly these columns: {expected_columns}")
     
     @staticmethod
-    def _validate_duplicate_ids(data: pd.DataFrame, id_column: str) -> pd.DataFrame:
+    def _validate_duplicate_ids(data: pd.DataFrame, id_column: str, seen_ids: Optional[SeenIds] = None) -> pd.DataFrame:
         """
         Internal method to check for duplicate IDs within the incoming DataFrame.
+        When the data arrives in chunks, `seen_ids` carries the IDs of the previous
+        chunks so duplicates across chunk boundaries are detected too. Those chunks
+        may already be loaded when a later one raises.
         Raises a ValueError if duplicates are found.
         """
-        data[id_column] = pd.to_numeric(data[id_column], errors="coerce").astype("Int64")
+        data[id_column] = DataValidation._to_numeric(data[id_column], "Int64")
         duplicate_ids = data[data.duplicated(subset=[id_column], keep=False)]
 
         if not duplicate_ids.empty:
             duplicate_ids = duplicate_ids[id_column].unique().tolist()
             raise ValueError(f"ERROR: Duplicate {id_column}s found in the input data: {duplicate_ids}. Please ensure all {id_column}s are unique.")
+
+        if seen_ids is not None:
+            chunk_ids = data[id_column].dropna().to_numpy(dtype=np.int64)
+            repeated_ids = np.unique(chunk_ids[seen_ids.isin(chunk_ids)]).tolist()
+
+            if repeated_ids:
+                raise ValueError(f"ERROR: Duplicate {id_column}s found in the input data: {repeated_ids}. Please ensure all {id_column}s are unique.")
+
+            seen_ids.update(chunk_ids)
         
-        return data
\ No newline at end of file
+        return data
+
+    @staticmethod
+    def _to_numeric(series: pd.Series, dtype: Optional[str] = None) -> pd.Series:
+        """
+        Internal method to coerce a column to a numeric dtype.
+        Columns the loader already parsed with the read schema are returned as they are.
+        """
+        if dtype is not None and series.dtype == dtype:
+            return series
+        if dtype is None and pd.api.types.is_numeric_dtype(series):
+            return series
+
+        converted = pd.to_numeric(series, errors="coerce")
+        return converted.astype(dtype) if dtype is not None else converted
+
+    @staticmethod
+    def _to_datetime(series: pd.Series) -> pd.Series:
+        """
+        Internal method to coerce a column to datetime, skipped when it is already parsed.
+        """
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return series
+        return pd.to_datetime(series, errors="coerce")
+
+    @staticmethod
+    def _to_categorical(series: pd.Series) -> pd.Series:
+        """
+        Internal method to store a low-cardinality column as a category dtype, so each
+        row keeps a small integer code instead of a Python string.
+        """
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            return series
+        return series.astype("category")
+
+    @staticmethod
+    def _apply_partitioned(data: pd.DataFrame, function: Callable[[pd.DataFrame], pd.DataFrame], workers: int = 1) -> pd.DataFrame:
+        """
+        Internal method to run a row-wise cleaning function over contiguous partitions
+        of the frame in the shared process pool, concatenating the results in partition order.
+        `function` must be picklable and must not depend on other rows; frames too small
+        to give every worker MIN_PARTITION_ROWS are cleaned in the current process.
+        """
+        partitions = min(workers, len(data) // DataValidation.MIN_PARTITION_ROWS)
+        if partitions <= 1:
+            return function(data)
+
+        bounds = np.linspace(0, len(data), partitions + 1, dtype=int)
+        with ProcessPool().lease(workers=partitions) as executor:
+            cleaned = list(executor.map(function, [data.iloc[start:end] for start, end in zip(bounds[:-1], bounds[1:])]))
+
+        return pd.concat(cleaned)
@@ -0,0 +1,50 @@
+from ...abstract.DataLoader import DataLoader
+from typing import Iterator, List, Optional
+import pandas as pd
+
+
+class ArrowLoader(DataLoader):
+    """
+    Columnar loader for Arrow IPC (Feather v2) files. The file is memory-mapped
+    and only the requested columns are materialized, keeping their native dtypes.
+    """
+    def __init__(self, filepath: str, columns: Optional[List[str]] = None, chunksize: Optional[int] = None):
+        self.filepath: str = filepath
+        self.columns: Optional[List[str]] = columns
+        self.chunksize: Optional[int] = chunksize
+
+    @staticmethod
+    def _pyarrow():
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("pyarrow is required to read Arrow files: pip install pyarrow") from e
+        return pa
+
+    def _read_table(self, source):
+        """
+        Internal method that reads the mapped file as a table of the requested columns.
+        Uncompressed columns are views over the map; compressed ones are decompressed.
+        """
+        table = self._pyarrow().ipc.open_file(source).read_all()
+        if self.columns is not None:
+            table = table.select(self.columns)
+        return table
+
+    def load(self):
+        print("Loading Arrow file...")
+        with self._pyarrow().memory_map(self.filepath, "r") as source:
+            return self._read_table(source).to_pandas()
+
+    def load_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Streams the Arrow IPC file as slices of at most `chunksize` rows.
+        """
+        if not self.chunksize:
+            yield self.load()
+            return
+
+        print(f"Loading Arrow file in chunks of {self.chunksize} rows...")
+        with self._pyarrow().memory_map(self.filepath, "r") as source:
+            for batch in self._read_table(source).to_batches(max_chunksize=self.chunksize):
+                yield batch.to_pandas()
@@ -1,11 +1,19 @@
 from ...abstract.DataLoader import DataLoader
+from typing import Optional
 import pandas as pd
 
 
 class JSONLoader(DataLoader):
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: str, schema: Optional[dict] = None):
         self.filepath: str = filepath
+        self.schema: dict = schema or {}
 
     def load(self):
-        print("Loading CSV file...")
-        return pd.read_json(self.filepath)
\ No newline at end of file
+        print("Loading JSON file...")
+        return pd.read_json(
+            self.filepath,
+            compression=self.detect_compression(self.filepath),
+            dtype=self.schema.get("dtype", True),
+            convert_dates=self.schema.get("parse_dates", not self.schema),
+            keep_default_dates=not self.schema
+        )
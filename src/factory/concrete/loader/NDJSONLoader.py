@@ -0,0 +1,48 @@
+from ...abstract.DataLoader import DataLoader
+from typing import Iterator, Optional
+import pandas as pd
+
+
+class NDJSONLoader(DataLoader):
+    """
+    Loader for newline-delimited JSON (one record per line), the format
+    event feeds arrive in. Unlike JSONLoader it can stream the file in chunks.
+    """
+    def __init__(self, filepath: str, chunksize: Optional[int] = None, schema: Optional[dict] = None):
+        self.filepath: str = filepath
+        self.chunksize: Optional[int] = chunksize
+        self.schema: dict = schema or {}
+
+    def _read_options(self) -> dict:
+        """
+        Internal method that turns the model read schema into pd.read_json arguments.
+        With a schema only its date columns are parsed, not every date-looking name.
+        Compressed files are decompressed on the fly while parsing.
+        """
+        return {
+            "lines": True,
+            "compression": self.detect_compression(self.filepath),
+            "dtype": self.schema.get("dtype", True),
+            "convert_dates": self.schema.get("parse_dates", not self.schema),
+            "keep_default_dates": not self.schema
+        }
+
+    def load(self):
+        print("Loading NDJSON file...")
+        return pd.read_json(self.filepath, **self._read_options())
+
+    def sample(self, nrows: int) -> pd.DataFrame:
+        return pd.read_json(self.filepath, nrows=nrows, **self._read_options())
+
+    def load_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Streams the NDJSON file as DataFrames of at most `chunksize` records.
+        """
+        if not self.chunksize:
+            yield self.load()
+            return
+
+        print(f"Loading NDJSON file in chunks of {self.chunksize} records...")
+        with pd.read_json(self.filepath, chunksize=self.chunksize, **self._read_options()) as reader:
+            for chunk in reader:
+                yield chunk
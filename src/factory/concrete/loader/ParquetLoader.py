@@ -0,0 +1,37 @@
+from ...abstract.DataLoader import DataLoader
+from typing import Iterator, List, Optional
+import pandas as pd
+
+
+class ParquetLoader(DataLoader):
+    """
+    Columnar loader for Parquet files. Only the requested columns are read
+    and they keep the native dtypes stored in the file, so no text parsing
+    or numeric coercion is needed.
+    """
+    def __init__(self, filepath: str, columns: Optional[List[str]] = None, chunksize: Optional[int] = None):
+        self.filepath: str = filepath
+        self.columns: Optional[List[str]] = columns
+        self.chunksize: Optional[int] = chunksize
+
+    def load(self):
+        print("Loading Parquet file...")
+        return pd.read_parquet(self.filepath, columns=self.columns, engine="pyarrow")
+
+    def load_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Streams the Parquet file as record batches of at most `chunksize` rows.
+        """
+        if not self.chunksize:
+            yield self.load()
+            return
+
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("pyarrow is required to read Parquet files: pip install pyarrow") from e
+
+        print(f"Loading Parquet file in chunks of {self.chunksize} rows...")
+        parquet_file = pq.ParquetFile(self.filepath)
+        for batch in parquet_file.iter_batches(batch_size=self.chunksize, columns=self.columns):
+            yield batch.to_pandas()
@@ -0,0 +1,337 @@
+import re
+from functools import partial
+import numpy as np
+import pandas as pd
+from typing import Callable, Optional
+from ....database.DataBase__singleton import MySQLConnector
+from ....database.KeyIndexCache import KeyIndexCache
+from ....monitoring.Metrics import MetricsRegistry
+from ...abstract.DataValidation import DataValidation, SeenIds
+
+
+CONTROL_CHARS = re.compile(r"[\r\n\t]")
+WHITESPACE = re.compile(r"\s+")
+ROWS_DROPPED = MetricsRegistry().counter(
+    "validation_rows_dropped_total", "Rows dropped by every validation step", ["model", "step"]
+)
+
+
+def _clean_name_function(rule: dict) -> Callable[[str], str]:
+    """
+    Builds the fused string cleaner for a clean_name rule: control characters,
+    whitespace collapsing, strip and case change applied to a value in one call.
+    """
+    replacement = rule.get("control_chars", "")
+    collapse = rule.get("collapse_whitespace", False)
+    case = rule.get("case")
+
+    def clean(value: str) -> str:
+        value = CONTROL_CHARS.sub(replacement, value)
+        if collapse:
+            value = WHITESPACE.sub(" ", value)
+        value = value.strip()
+        if case == "lower":
+            return value.lower()
+        if case == "title":
+            return value.title()
+        if case == "upper":
+            return value.upper()
+        return value
+
+    return clean
+
+
+def _upper_enum_function(rule: dict) -> Callable[[str], Optional[str]]:
+    """
+    Builds the cleaner for an upper_enum rule: values outside the allowed set,
+    or of a different length, become null.
+    """
+    allowed = set(rule["allowed"]) if "allowed" in rule else None
+    length = rule.get("length")
+
+    def clean(value: str) -> Optional[str]:
+        value = value.strip().upper()
+        if allowed is not None and value not in allowed:
+            return None
+        if length is not None and len(value) != length:
+            return None
+        return value
+
+    return clean
+
+
+def _bool_map_function(rule: dict) -> Callable[[str], Optional[int]]:
+    """
+    Builds the cleaner for a bool_map rule: the true/false tokens become 1/0, anything else null.
+    """
+    mapping = {rule["true"]: 1, rule["false"]: 0}
+
+    def clean(value: str) -> Optional[int]:
+        return mapping.get(value.strip().upper())
+
+    return clean
+
+
+STRING_RULES: dict = {
+    "clean_name": _clean_name_function,
+    "upper_enum": _upper_enum_function,
+    "bool_map": _bool_map_function
+}
+
+def _clean_partition(spec: dict, data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cleans one partition of a frame with the rules of a spec, run inside the worker processes.
+    """
+    validation = RuleBasedValidation(spec=spec, data=data)
+    validation._clean_data()
+    return validation.data
+
+
+# pull: read the whole key column; probe: batched IN lookups; temp_table: anti-join in MySQL
+EXISTING_FILTERS: tuple = ("pull", "probe", "temp_table", "none")
+
+
+class RuleBasedValidation(DataValidation):
+    """
+    Validation driven by a declarative spec (see ValidationSpecs). String rules
+    are fused into a single function that runs once per distinct value, and the
+    dropna and rename run once over the whole frame. With several workers the
+    column rules run over partitions in the shared process pool, while the checks that
+    need the whole frame (columns, duplicate IDs, existing rows, foreign keys)
+    stay in the calling process.
+    """
+    PROBE_BATCH_SIZE: int = 1000
+
+    def __init__(
+        self,
+        spec: dict,
+        data: pd.DataFrame,
+        seen_ids: Optional[SeenIds] = None,
+        check_foreign_keys: bool = True,
+        existing_filter: str = "probe",
+        workers: int = 1
+    ):
+        if existing_filter not in EXISTING_FILTERS:
+            raise ValueError(f"ERROR: Unknown existing filter '{existing_filter}', expected one of {EXISTING_FILTERS}")
+
+        self.spec: dict = spec
+        self.data: pd.DataFrame = data
+        self.seen_ids: Optional[SeenIds] = seen_ids
+        self.check_foreign_keys: bool = check_foreign_keys
+        self.existing_filter: str = existing_filter
+        self.workers: int = workers
+        self.expected_columns: list = spec["expected_columns"]
+        self.memory_saved: int = 0
+        self.dropped: dict = {}
+
+    @staticmethod
+    def _apply_string_rule(series: pd.Series, clean: Callable) -> pd.Series:
+        """
+        Internal method that applies a fused cleaner to a column. The column is
+        factorized first, so the cleaner runs once per distinct value and the
+        result is built with a single take over the codes. Nulls stay null.
+        Categorical columns are cleaned on their categories and stay categorical.
+        """
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            return RuleBasedValidation._apply_category_rule(series, clean)
+
+        codes, uniques = pd.factorize(series, use_na_sentinel=True)
+        cleaned = np.empty(len(uniques) + 1, dtype=object)
+        cleaned[:-1] = [clean(value if isinstance(value, str) else str(value)) for value in uniques]
+        cleaned[-1] = None
+        return pd.Series(cleaned.take(codes), index=series.index, name=series.name)
+
+    @staticmethod
+    def _apply_category_rule(series: pd.Series, clean: Callable) -> pd.Series:
+        """
+        Internal method that applies a fused cleaner to the categories of a column.
+        Categories that clean to the same value are merged by remapping the codes,
+        and the new categories depend only on the old ones, so partitions of the
+        same column still share their dtype.
+        """
+        categories = series.cat.categories
+        cleaned = [clean(value if isinstance(value, str) else str(value)) for value in categories]
+        new_codes, new_categories = pd.factorize(pd.Series(cleaned, dtype=object), use_na_sentinel=True)
+        remap = np.append(new_codes, -1)
+        codes = remap.take(series.cat.codes.to_numpy())
+        return pd.Series(
+            pd.Categorical.from_codes(codes, categories=new_categories),
+            index=series.index,
+            name=series.name
+        )
+
+    def _clean_column(self, column: str, rule: dict) -> pd.Series:
+        """
+        Internal method that cleans one column according to its rule.
+        """
+        series = self.data[column]
+        kind = rule["rule"]
+
+        if kind in STRING_RULES:
+            cleaned = self._apply_string_rule(series, STRING_RULES[kind](rule))
+            return cleaned.astype("Int64") if kind == "bool_map" else cleaned
+        if kind == "nullable_int":
+            return super()._to_numeric(series, "Int64")
+        if kind == "float":
+            return super()._to_numeric(series, "float64")
+        if kind == "date":
+            return super()._to_datetime(series)
+        raise ValueError(f"ERROR: Unknown validation rule '{kind}' for column {column}")
+
+    def _encode_categories(self) -> None:
+        """
+        Internal method that converts the spec's low-cardinality columns to category
+        dtypes before cleaning, recording the bytes saved. The values are only
+        expanded back to strings when the frame is written to the staging file.
+        """
+        for column in self.spec.get("categorical", []):
+            before = self.data[column].memory_usage(deep=True, index=False)
+            self.data[column] = super()._to_categorical(self.data[column])
+            self.memory_saved += before - self.data[column].memory_usage(deep=True, index=False)
+
+    def _clean_data(self) -> None:
+        """
+        Internal method that applies every column rule of the spec.
+        """
+        for column, rule in self.spec["rules"].items():
+            self.data[column] = self._clean_column(column, rule)
+
+    @staticmethod
+    def _normalized(existing: dict, saved: list) -> list:
+        """
+        Internal method that lower-cases and strips the saved keys of a "normalize" spec.
+        The database compares the bare indexed column (its collation is case-insensitive),
+        so the keys it returns are normalized here, where the incoming ones already are.
+        """
+        if existing.get("normalize"):
+            return [str(value).lower().strip() for value in saved]
+        return saved
+
+    def _saved_keys_pull(self, db: MySQLConnector, existing: dict) -> list:
+        """
+        Internal method that reads every saved key of the table into Python.
+        """
+        saved = [row[0] for row in db.query_select(query=f"SELECT DISTINCT({existing['key']}) FROM {existing['table']};")]
+        return self._normalized(existing, saved)
+
+    def _saved_keys_probe(self, db: MySQLConnector, existing: dict, incoming: list) -> list:
+        """
+        Internal method that asks the database which incoming keys are already saved,
+        in batched IN lookups, so only the matches travel back. Full batches share
+        one prepared statement. The key column is compared bare, so the lookups use its index.
+        """
+        key = existing["key"]
+        saved = []
+        for start in range(0, len(incoming), self.PROBE_BATCH_SIZE):
+            batch = incoming[start:start + self.PROBE_BATCH_SIZE]
+            placeholders = ", ".join(["%s"] * len(batch))
+            query = f"SELECT DISTINCT {key} FROM {existing['table']} WHERE {key} IN ({placeholders});"
+            saved.extend(row[0] for row in db.query_prepared(query=query, params=batch))
+        return self._normalized(existing, saved)
+
+    def _new_keys_temp_table(self, db: MySQLConnector, existing: dict, incoming: list) -> list:
+        """
+        Internal method that stages the incoming keys in a temporary table and
+        anti-joins it with the target table, so MySQL returns only the new keys.
+        The join is on the bare key column, so it probes its index.
+        """
+        temp_table = f"incoming_{existing['table']}_keys"
+        # temporary tables live in one session, so every statement runs on the same pooled connection
+        with db.connection():
+            db.execute(query=f"DROP TEMPORARY TABLE IF EXISTS {temp_table};")
+            db.execute(
+                query=f"CREATE TEMPORARY TABLE {temp_table} (UNIQUE (k)) "
+                      f"SELECT {existing['key']} AS k FROM {existing['table']} LIMIT 0;"
+            )
+            try:
+                db.execute_many(query=f"INSERT INTO {temp_table} (k) VALUES (%s);", rows=[(key,) for key in incoming])
+                rows = db.query_select(
+                    query=f"SELECT t.k FROM {temp_table} t LEFT JOIN {existing['table']} s "
+                          f"ON s.{existing['key']} = t.k WHERE s.{existing['key']} IS NULL;"
+                )
+            finally:
+                db.execute(query=f"DROP TEMPORARY TABLE IF EXISTS {temp_table};")
+        return [row[0] for row in rows]
+
+    def _drop_existing(self, db: MySQLConnector) -> None:
+        """
+        Internal method that drops the rows whose key is already saved in the database,
+        with the configured existing filter. The "none" filter keeps them, for loads
+        that replace or merge the saved rows.
+        """
+        existing = self.spec.get("existing")
+        if not existing or self.existing_filter == "none":
+            return
+
+        keys = self.data[existing["column"]]
+        if self.existing_filter == "pull":
+            saved = keys.isin(self._saved_keys_pull(db=db, existing=existing))
+        else:
+            incoming = keys.dropna().unique().tolist()
+            if not incoming:
+                return
+            if self.existing_filter == "probe":
+                saved = keys.isin(self._saved_keys_probe(db=db, existing=existing, incoming=incoming))
+            else:
+                saved = keys.notna() & ~keys.isin(self._new_keys_temp_table(db=db, existing=existing, incoming=incoming))
+
+        self.data = self.data[~saved].copy()
+
+    def _drop_orphans(self, db: MySQLConnector) -> None:
+        """
+        Internal method that drops the rows whose foreign keys don't exist in their
+        parent table, probing the cached key indexes of KeyIndexCache.
+        """
+        foreign_keys = self.spec.get("foreign_keys")
+        if not foreign_keys or not self.check_foreign_keys:
+            return
+
+        cache = KeyIndexCache()
+        valid = np.ones(len(self.data), dtype=bool)
+        for column, parent in foreign_keys.items():
+            found = cache.contains(db=db, table=parent["table"], column=parent["column"], values=self.data[column])
+            missing = int((~found & valid).sum())
+            if missing:
+                print(f"Dropping {missing} {self.spec['model']} rows with a {column} missing in {parent['table']}")
+            valid &= found
+
+        if not valid.all():
+            self.data = self.data[valid].copy()
+
+    def _count_dropped(self, step: str, before: int) -> None:
+        """
+        Internal method that records the rows a validation step dropped.
+        """
+        dropped = before - len(self.data)
+        self.dropped[step] = dropped
+        if dropped:
+            ROWS_DROPPED.inc(dropped, model=self.spec["model"], step=step)
+
+    def validate(self, db: MySQLConnector) -> pd.DataFrame:
+        model = self.spec["model"]
+        print(f"Validating {model} CSV file...")
+
+        super()._validate_columns(model=model, data=self.data, expected_columns=self.expected_columns)
+        before = len(self.data)
+        self.data = super()._validate_duplicate_ids(data=self.data, id_column=self.spec["id_column"], seen_ids=self.seen_ids)
+        self._count_dropped(step="duplicate_ids", before=before)
+        self._encode_categories()
+        self.data = super()._apply_partitioned(data=self.data, function=partial(_clean_partition, self.spec), workers=self.workers)
+
+        before = len(self.data)
+        self._drop_existing(db=db)
+        self._count_dropped(step="existing", before=before)
+
+        before = len(self.data)
+        self._drop_orphans(db=db)
+        self._count_dropped(step="orphans", before=before)
+
+        if self.spec["dropna"]:
+            before = len(self.data)
+            self.data.dropna(subset=self.spec["dropna"], inplace=True)
+            self._count_dropped(step="dropna", before=before)
+
+        self.data.rename(columns=self.spec["rename"], inplace=True)
+
+        print(f"{model} validation passed.")
+        return self.data
@@ -0,0 +1,258 @@
+'''
+Declarative validation specs, one per model.
+
+Every spec describes the source file (expected columns and the read schema the
+loaders parse it with) and how RuleBasedValidation cleans it:
+
+- id_column: column checked for duplicate IDs (also across chunks)
+- categorical: low-cardinality columns kept as category dtypes; their rules run on the categories
+- rules: per-column cleaning rule
+    * clean_name:  remove control characters, strip and change the case, in one pass
+    * upper_enum:  strip and upper-case, keeping only the allowed values / length
+    * bool_map:    upper-case and map to 1/0, anything else becomes null
+    * nullable_int, float, date: typed coercion (skipped if the loader already parsed it)
+- existing: rows whose key is already saved in table.key are dropped; "normalize"
+  compares the lower-cased, stripped database values. The database side compares
+  the bare table.key, which must be indexed (see create_tables.sql), and relies on
+  the case-insensitive collation and on the key column's clean_name rule
+- foreign_keys: column -> parent table/column; rows pointing to a missing parent are dropped
+- dropna: columns that can't be null after cleaning
+- rename: source column -> database column
+'''
+
+VALIDATION_SPECS: dict = {
+    "categories": {
+        "model": "Categories",
+        "expected_columns": ["CategoryID", "CategoryName"],
+        "read_schema": {
+            "dtype": {"CategoryID": "Int64", "CategoryName": "object"}
+        },
+        "id_column": "CategoryID",
+        "rules": {
+            "CategoryName": {"rule": "clean_name", "case": "lower"}
+        },
+        "existing": {
+            "table": "categories",
+            "key": "category_name",
+            "column": "CategoryName",
+            "normalize": True
+        },
+        "dropna": [],
+        "rename": {
+            "CategoryID": "category_id",
+            "CategoryName": "category_name"
+        }
+    },
+    "cities": {
+        "model": "Cities",
+        "expected_columns": ["CityID", "CityName", "Zipcode", "CountryID"],
+        "read_schema": {
+            "dtype": {"CityID": "Int64", "CityName": "object", "Zipcode": "Int64", "CountryID": "Int64"}
+        },
+        "id_column": "CityID",
+        "rules": {
+            "CityName": {"rule": "clean_name", "case": "lower"},
+            "CountryID": {"rule": "nullable_int"}
+        },
+        "existing": {
+            "table": "cities",
+            "key": "city_name",
+            "column": "CityName",
+            "normalize": True
+        },
+        "dropna": [],
+        "rename": {
+            "CityID": "city_id",
+            "CityName": "city_name",
+            "Zipcode": "zipcode",
+            "CountryID": "country_id"
+        }
+    },
+    "countries": {
+        "model": "Countries",
+        "expected_columns": ["CountryID", "CountryName", "CountryCode"],
+        # "NA" is a valid country code, so only empty cells are read as missing
+        "read_schema": {
+            "dtype": {"CountryID": "Int64", "CountryName": "object", "CountryCode": "object"},
+            "na_values": ["", "NULL"],
+            "keep_default_na": False
+        },
+        "id_column": "CountryID",
+        "rules": {
+            "CountryName": {"rule": "clean_name", "case": "lower"}
+        },
+        "existing": {
+            "table": "countries",
+            "key": "country_name",
+            "column": "CountryName",
+            "normalize": True
+        },
+        "dropna": [],
+        "rename": {
+            "CountryID": "country_id",
+            "CountryName": "country_name",
+            "CountryCode": "country_code"
+        }
+    },
+    "customers": {
+        "model": "Customers",
+        "expected_columns": ["CustomerID", "FirstName", "MiddleInitial", "LastName", "CityID", "Address"],
+        "read_schema": {
+            "dtype": {
+                "CustomerID": "Int64", "FirstName": "object", "MiddleInitial": "object",
+                "LastName": "object", "CityID": "Int64", "Address": "object"
+            }
+        },
+        "id_column": "CustomerID",
+        "categorical": ["FirstName", "LastName", "MiddleInitial"],
+        "rules": {
+            "FirstName": {"rule": "clean_name", "case": "title"},
+            "LastName": {"rule": "clean_name", "case": "title"},
+            "MiddleInitial": {"rule": "upper_enum", "length": 1},
+            "Address": {"rule": "clean_name", "control_chars": " ", "collapse_whitespace": True},
+            "CityID": {"rule": "nullable_int"}
+        },
+        "existing": None,
+        "dropna": ["CustomerID", "FirstName", "LastName", "CityID", "Address"],
+        "rename": {
+            "CustomerID": "customer_id",
+            "FirstName": "first_name",
+            "MiddleInitial": "middle_initial",
+            "LastName": "last_name",
+            "CityID": "city_id",
+            "Address": "address"
+        }
+    },
+    "employees": {
+        "model": "Employees",
+        "expected_columns": [
+            "EmployeeID", "FirstName", "MiddleInitial", "LastName",
+            "BirthDate", "Gender", "CityID", "HireDate"
+        ],
+        "read_schema": {
+            "dtype": {
+                "EmployeeID": "Int64", "FirstName": "object", "MiddleInitial": "object",
+                "LastName": "object", "Gender": "object", "CityID": "Int64"
+            },
+            "parse_dates": ["BirthDate", "HireDate"]
+        },
+        "id_column": "EmployeeID",
+        "categorical": ["MiddleInitial", "Gender"],
+        "rules": {
+            "FirstName": {"rule": "clean_name", "case": "title"},
+            "LastName": {"rule": "clean_name", "case": "title"},
+            "MiddleInitial": {"rule": "upper_enum", "length": 1},
+            "Gender": {"rule": "upper_enum", "allowed": ["M", "F"]},
+            "BirthDate": {"rule": "date"},
+            "HireDate": {"rule": "date"},
+            "CityID": {"rule": "nullable_int"}
+        },
+        "existing": None,
+        "dropna": [
+            "EmployeeID", "FirstName", "LastName", "BirthDate",
+            "Gender", "CityID", "HireDate"
+        ],
+        "rename": {
+            "EmployeeID": "employee_id",
+            "FirstName": "first_name",
+            "MiddleInitial": "middle_initial",
+            "LastName": "last_name",
+            "BirthDate": "birth_date",
+            "Gender": "gender",
+            "CityID": "city_id",
+            "HireDate": "hire_date"
+        }
+    },
+    "products": {
+        "model": "Products",
+        "expected_columns": [
+            "ProductID", "ProductName", "Price", "CategoryID", "Class",
+            "ModifyDate", "Resistant", "IsAllergic", "VitalityDays"
+        ],
+        # ModifyDate comes in a partial time format pandas can't infer, so it is parsed during cleaning
+        "read_schema": {
+            "dtype": {
+                "ProductID": "Int64", "ProductName": "object", "Price": "float64", "CategoryID": "Int64",
+                "Class": "object", "ModifyDate": "object", "Resistant": "object", "IsAllergic": "object",
+                "VitalityDays": "Int64"
+            }
+        },
+        "id_column": "ProductID",
+        "categorical": ["Class", "Resistant", "IsAllergic"],
+        "rules": {
+            "ProductName": {"rule": "clean_name", "case": "title"},
+            "Class": {"rule": "clean_name", "case": "title"},
+            "IsAllergic": {"rule": "bool_map", "true": "TRUE", "false": "FALSE"},
+            "Price": {"rule": "float"},
+            "CategoryID": {"rule": "nullable_int"},
+            "VitalityDays": {"rule": "nullable_int"},
+            "ModifyDate": {"rule": "date"}
+        },
+        "existing": {
+            "table": "products",
+            "key": "id",
+            "column": "ProductID",
+            "normalize": False
+        },
+        "dropna": [
+            "ProductID", "ProductName", "Price", "CategoryID",
+            "ModifyDate", "IsAllergic", "VitalityDays"
+        ],
+        "rename": {
+            "ProductID": "id",
+            "ProductName": "name",
+            "Price": "price",
+            "CategoryID": "category",
+            "Class": "class_type",
+            "ModifyDate": "modify_date",
+            "Resistant": "resistant",
+            "IsAllergic": "is_allergic",
+            "VitalityDays": "vitality_days"
+        }
+    },
+    "sales": {
+        "model": "Sales",
+        "expected_columns": [
+            "SalesID", "SalesPersonID", "CustomerID", "ProductID",
+            "Quantity", "Discount", "TotalPrice", "SalesDate", "TransactionNumber"
+        ],
+        "read_schema": {
+            "dtype": {
+                "SalesID": "Int64", "SalesPersonID": "Int64", "CustomerID": "Int64", "ProductID": "Int64",
+                "Quantity": "Int64", "Discount": "float64", "TotalPrice": "float64",
+                "SalesDate": "object", "TransactionNumber": "object"
+            }
+        },
+        "id_column": "SalesID",
+        "rules": {
+            "TransactionNumber": {"rule": "clean_name", "case": "title"},
+            "SalesPersonID": {"rule": "nullable_int"},
+            "CustomerID": {"rule": "nullable_int"},
+            "ProductID": {"rule": "nullable_int"},
+            "Quantity": {"rule": "nullable_int"},
+            "Discount": {"rule": "float"},
+            "TotalPrice": {"rule": "float"}
+        },
+        "existing": None,
+        "foreign_keys": {
+            "SalesPersonID": {"table": "employees", "column": "employee_id"},
+            "CustomerID": {"table": "customers", "column": "customer_id"},
+            "ProductID": {"table": "products", "column": "id"}
+        },
+        "dropna": [
+            "SalesID", "SalesPersonID", "CustomerID", "ProductID",
+            "Quantity", "Discount", "TotalPrice", "SalesDate", "TransactionNumber"
+        ],
+        "rename": {
+            "SalesID": "sales_id",
+            "SalesPersonID": "sales_person_id",
+            "CustomerID": "customer_id",
+            "ProductID": "product_id",
+            "Quantity": "quantity",
+            "Discount": "discount",
+            "TotalPrice": "total_price",
+            "SalesDate": "sales_date",
+            "TransactionNumber": "transaction_number"
+        }
+    }
+}
@@ -1,9 +1,33 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from .app.api import router
+from fastapi.responses import PlainTextResponse
+from .app.api import router, data_upload_controller
+from .monitoring.Metrics import MetricsRegistry
+from .factory.ProcessPool import ProcessPool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await data_upload_controller.jobs.shutdown()
+    data_upload_controller.executor.shutdown(wait=False)
+    ProcessPool().shutdown()
+    await data_upload_controller.async_db_connector.dispose()
+
 
 app = FastAPI(
     title="Proyecto Final Entregable Henry - Capacitacion Accenture",
-    version="1.0"
+    version="1.0",
+    lifespan=lifespan
 )
 
-app.include_router(router)
\ No newline at end of file
+app.include_router(router)
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint() -> PlainTextResponse:
+    """
+    Endpoint with the pipeline metrics (stage durations, rows, bytes, database calls)
+    in the Prometheus text format.
+    """
+    return PlainTextResponse(MetricsRegistry().render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,128 @@
+import threading
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.pool import NullPool
+
+from src.database import DataBase__singleton
+from src.database.DataBase__singleton import MySQLConnector
+
+
+class StandInCursor:
+    def execute(self, query, params=None):
+        pass
+
+    def fetchall(self):
+        return [(1,)]
+
+    def close(self):
+        pass
+
+
+class StandInConnection:
+    def __init__(self, pool):
+        self.pool = pool
+        self.in_transaction = False
+
+    def cursor(self, **kwargs):
+        # like InnoDB without autocommit, the first statement opens a transaction
+        self.in_transaction = True
+        return StandInCursor()
+
+    def rollback(self):
+        self.in_transaction = False
+
+    def close(self):
+        self.pool.returned.append(self.in_transaction)
+        self.pool.checked_out -= 1
+
+
+class StandInPool:
+    """
+    Local stand-in for MySQLConnectionPool: hands out connections up to its size
+    and fails like the driver does when it is exhausted.
+    """
+
+    def __init__(self, pool_size, **kwargs):
+        self.pool_size = pool_size
+        self.kwargs = kwargs
+        self.checked_out = 0
+        self.returned = []
+        self.peak = 0
+
+    def get_connection(self):
+        if self.checked_out >= self.pool_size:
+            raise RuntimeError("Failed getting connection; pool exhausted")
+        self.checked_out += 1
+        self.peak = max(self.peak, self.checked_out)
+        return StandInConnection(self)
+
+
+@pytest.fixture
+def db(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "2")
+    monkeypatch.setenv("DB_POOL_TIMEOUT", "0.2")
+    monkeypatch.setattr(DataBase__singleton, "MySQLConnectionPool", StandInPool)
+    monkeypatch.setattr(MySQLConnector, "_instance", None)
+    connector = MySQLConnector()
+    connector.connect()
+    yield connector
+    connector.engine.dispose()
+
+
+def test_engine_shares_the_driver_pool(db):
+    assert db.pool.pool_size == 2
+    assert isinstance(db.engine.pool, NullPool)
+    assert event.contains(db.engine, "close", db._release_engine_connection)
+
+    connection = db._engine_connection()
+    assert db.pool.checked_out == 1
+
+    connection.close()
+    db._release_engine_connection(connection, None)
+    assert db.pool.checked_out == 0
+
+
+def test_pool_size_caps_driver_and_engine_connections(db):
+    with db.connection():
+        engine_connection = db._engine_connection()
+
+        with pytest.raises(TimeoutError):
+            db._engine_connection()
+        with pytest.raises(TimeoutError):
+            with db._checkout():
+                pass
+
+        engine_connection.close()
+        db._release_engine_connection(engine_connection, None)
+        with db._checkout():
+            assert db.pool.checked_out == 2
+
+
+def test_exhausted_pool_waits_for_a_free_connection(db):
+    held = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with db._checkout():
+            held.set()
+            release.wait()
+
+    threads = [threading.Thread(target=hold) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    while db.pool.checked_out < 2:
+        held.wait(0.01)
+
+    threading.Timer(0.05, release.set).start()
+    with db._checkout():
+        assert db.pool.checked_out <= 2
+    for thread in threads:
+        thread.join()
+    assert db.pool.peak == 2
+
+
+def test_reads_return_their_connection_without_an_open_transaction(db):
+    assert db.query_select("SELECT 1;") == [(1,)]
+
+    assert db.pool.returned == [False]
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.factory.abstract.DataValidation import DataValidation, SeenIds
+
+
+def validate_chunks(chunks, seen_ids):
+    for chunk in chunks:
+        DataValidation._validate_duplicate_ids(pd.DataFrame({"id": chunk}), "id", seen_ids)
+
+
+def test_seen_ids_membership_across_runs():
+    seen_ids = SeenIds()
+    for start in range(0, 1000, 100):
+        seen_ids.update(np.arange(start, start + 100, dtype=np.int64)[::-1])
+
+    assert len(seen_ids.runs) < 10
+    assert seen_ids.nbytes == 1000 * 8
+    assert seen_ids.isin(np.array([999, 5, 1000, -1, 500])).tolist() == [True, True, False, False, True]
+
+
+def test_duplicate_ids_across_chunks_are_rejected():
+    seen_ids = SeenIds()
+    validate_chunks([[5, 3, 9], [1, 10, 4], [7, 2]], seen_ids)
+
+    with pytest.raises(ValueError, match=r"\[3, 9\]"):
+        validate_chunks([[11, 9, 3, 100]], seen_ids)
+
+
+def test_duplicate_ids_within_a_chunk_are_rejected():
+    with pytest.raises(ValueError):
+        validate_chunks([[1, 2, 2]], SeenIds())
+
+
+def test_unique_ids_across_many_chunks_pass():
+    ids = np.random.default_rng(0).permutation(50000)
+    seen_ids = SeenIds()
+    validate_chunks(np.array_split(ids, 40), seen_ids)
+
+    assert seen_ids.isin(ids).all()
+    assert seen_ids.nbytes == 50000 * 8
@@ -0,0 +1,70 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from src.app.controller import DataUploadController
+from src.main import app
+
+UPLOAD_SECONDS = 1.0
+
+
+@pytest.fixture
+def blocking_pipeline(monkeypatch):
+    """
+    Replaces the model pipeline with a blocking sleep, standing in for the pandas
+    and mysql.connector work of a real upload.
+    """
+    def run_pipeline(self, model_class, progress=None):
+        time.sleep(UPLOAD_SECONDS)
+        return {"rows_loaded": 0}
+
+    monkeypatch.setattr(DataUploadController, "_run_pipeline", run_pipeline)
+
+
+def request_during_upload(upload_url: str) -> tuple:
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            upload = asyncio.create_task(client.post(upload_url))
+            await asyncio.sleep(0.1)
+
+            started = time.perf_counter()
+            response = await client.get("/pipeline/cache")
+            elapsed = time.perf_counter() - started
+            upload_running = not upload.done()
+
+            return response, elapsed, upload_running, await upload
+
+    return asyncio.run(scenario())
+
+
+def test_get_is_served_while_waiting_upload_runs(blocking_pipeline):
+    response, elapsed, upload_running, upload_response = request_during_upload("/pipeline/upload/categories?wait=true")
+
+    assert response.status_code == 200
+    assert upload_running
+    assert elapsed < UPLOAD_SECONDS / 2
+    assert upload_response.status_code == 200
+
+
+def test_upload_job_is_enqueued_without_blocking(blocking_pipeline):
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            started = time.perf_counter()
+            upload_response = await client.post("/pipeline/upload/categories")
+            elapsed = time.perf_counter() - started
+            job = (await client.get(upload_response.json()["status_url"])).json()
+
+            while job["status"] in ("queued", "running"):
+                await asyncio.sleep(0.05)
+                job = (await client.get(upload_response.json()["status_url"])).json()
+            return upload_response, elapsed, job
+
+    upload_response, elapsed, job = asyncio.run(scenario())
+
+    assert upload_response.status_code == 202
+    assert elapsed < UPLOAD_SECONDS / 2
+    assert job["status"] == "succeeded"
@@ -0,0 +1,53 @@
+from contextlib import contextmanager
+
+import pandas as pd
+import pytest
+
+from src.factory.DataValidationFactory import DataValidationFactory
+
+
+class FakeDB:
+    """
+    Stand-in for MySQLConnector that records the SQL it gets. The saved keys come
+    back with the table's case, as MySQL's case-insensitive collation returns them.
+    """
+
+    def __init__(self, saved: list):
+        self.saved = saved
+        self.queries = []
+
+    def _matches(self, keys):
+        return [(value,) for value in self.saved if value.lower() in {str(key).lower() for key in keys}]
+
+    def query_select(self, query, params=None):
+        self.queries.append(query)
+        if query.startswith("SELECT t.k"):
+            return [(key,) for key in self.incoming if key.lower() not in {value.lower() for value in self.saved}]
+        return [(value,) for value in self.saved]
+
+    def query_prepared(self, query, params=None):
+        self.queries.append(query)
+        return self._matches(params)
+
+    @contextmanager
+    def connection(self):
+        yield self
+
+    def execute(self, query, params=None):
+        self.queries.append(query)
+
+    def execute_many(self, query, rows):
+        self.queries.append(query)
+        self.incoming = [row[0] for row in rows]
+
+
+@pytest.mark.parametrize("existing_filter", ["pull", "probe", "temp_table"])
+def test_saved_categories_are_dropped_comparing_the_bare_column(existing_filter):
+    db = FakeDB(saved=["Snacks", "beverages"])
+    data = pd.DataFrame({"CategoryName": ["snacks", "dairy", "beverages"]})
+    validation = DataValidationFactory.get_validation_class(model="categories", data=data, existing_filter=existing_filter)
+
+    validation._drop_existing(db=db)
+
+    assert validation.data["CategoryName"].tolist() == ["dairy"]
+    assert not any("LOWER(" in query or "TRIM(" in query for query in db.queries)
@@ -0,0 +1,106 @@
+import pandas as pd
+import pytest
+
+from src.database.KeyIndexCache import KeyIndexCache
+from src.factory.DataValidationFactory import DataValidationFactory
+from src.models.Sales import Sale
+from src.pipelines.DataIngestion import DataIngestion
+
+
+class FakeDB:
+    """
+    Stand-in for MySQLConnector whose parent tables are plain lists. stream_select
+    yields them in small batches and counts the reads of every table.
+    """
+
+    def __init__(self, tables: dict):
+        self.tables = tables
+        self.reads = {}
+
+    def stream_select(self, query, params=None, batch_size=2):
+        table = query.rstrip(";").split(" ")[3]
+        self.reads[table] = self.reads.get(table, 0) + 1
+        rows = [(value,) for value in self.tables[table]]
+        for start in range(0, len(rows), batch_size):
+            yield rows[start:start + batch_size]
+
+    def query_select(self, query, params=None):
+        return []
+
+    def connect(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    KeyIndexCache().clear()
+    yield
+    KeyIndexCache().clear()
+
+
+def sales(rows: list) -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {
+                "SalesID": sales_id, "SalesPersonID": employee, "CustomerID": customer, "ProductID": product,
+                "Quantity": 1, "Discount": 0.0, "TotalPrice": 10.0,
+                "SalesDate": "2018-02-05 07:38:25.430", "TransactionNumber": "ABC"
+            }
+            for sales_id, employee, customer, product in rows
+        ]
+    ).astype({"SalesID": "Int64", "SalesPersonID": "Int64", "CustomerID": "Int64", "ProductID": "Int64"})
+
+
+def validate(db: FakeDB, data: pd.DataFrame, check_foreign_keys: bool = True):
+    validation = DataValidationFactory.get_validation_class(model="sales", data=data, check_foreign_keys=check_foreign_keys)
+    validated = validation.validate(db=db)
+    return validated, validation.dropped
+
+
+def parents() -> dict:
+    return {"employees": [1, 2], "customers": [10, 11, 12], "products": [100, 101, 102, 103, 104]}
+
+
+def test_orphans_are_dropped_and_counted():
+    db = FakeDB(tables=parents())
+    data = sales([(1, 1, 10, 100), (2, 3, 10, 100), (3, 1, 99, 105), (4, 2, 12, 104), (5, 1, None, 101)])
+
+    validated, dropped = validate(db=db, data=data)
+
+    assert validated["sales_id"].tolist() == [1, 4]
+    assert dropped["orphans"] == 2
+    assert dropped["dropna"] == 1
+
+
+def test_parent_keys_are_read_once_and_again_after_a_reload():
+    db = FakeDB(tables=parents())
+    validate(db=db, data=sales([(1, 1, 10, 100)]))
+    validate(db=db, data=sales([(2, 2, 11, 101)]))
+
+    assert db.reads == {"employees": 1, "customers": 1, "products": 1}
+
+    db.tables["products"] = [100, 200]
+    KeyIndexCache().invalidate(table="products")
+    validated, dropped = validate(db=db, data=sales([(3, 1, 10, 101), (4, 1, 10, 200)]))
+
+    assert db.reads == {"employees": 1, "customers": 1, "products": 2}
+    assert validated["sales_id"].tolist() == [4]
+    assert dropped["orphans"] == 1
+
+
+def test_orphans_are_kept_when_foreign_keys_are_not_checked():
+    db = FakeDB(tables=parents())
+    data = sales([(1, 1, 10, 100), (2, 3, 99, 105)])
+
+    validated, dropped = validate(db=db, data=data, check_foreign_keys=False)
+
+    assert validated["sales_id"].tolist() == [1, 2]
+    assert dropped["orphans"] == 0
+    assert db.reads == {}
+
+
+def test_validate_foreign_keys_env_turns_the_check_off(monkeypatch):
+    monkeypatch.setenv("VALIDATE_FOREIGN_KEYS", "0")
+    ingestion = DataIngestion(model_class=Sale, loader_type="csv", database=FakeDB(tables={}))
+
+    assert ingestion.check_foreign_keys is False
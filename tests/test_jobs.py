@@ -0,0 +1,68 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from src.app.api import data_upload_controller
+from src.app.controller import DataUploadController
+from src.app.jobs import UploadJobManager
+from src.main import app
+
+
+@pytest.fixture
+def pipeline_runs(monkeypatch):
+    """
+    Stubs the model pipeline with a short blocking sleep and counts its runs per model.
+    """
+    runs = {}
+    lock = threading.Lock()
+
+    def run_pipeline(self, model_class, progress=None):
+        with lock:
+            runs[model_class.__name__] = runs.get(model_class.__name__, 0) + 1
+        time.sleep(0.3)
+        return {"rows_loaded": 1}
+
+    monkeypatch.setattr(DataUploadController, "_run_pipeline", run_pipeline)
+    monkeypatch.setattr(data_upload_controller, "jobs", UploadJobManager(max_running=1, max_queued=2))
+    return runs
+
+
+def post_all(*urls: str) -> list:
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = []
+            for url in urls:
+                responses.append(asyncio.create_task(client.post(url)))
+                await asyncio.sleep(0.05)
+            return await asyncio.gather(*responses)
+
+    return asyncio.run(scenario())
+
+
+def test_waiting_retries_share_one_upload(pipeline_runs):
+    first, retry = post_all("/pipeline/upload/categories?wait=true", "/pipeline/upload/categories?wait=true")
+
+    assert first.status_code == retry.status_code == 200
+    assert first.json() == retry.json()
+    assert pipeline_runs == {"Category": 1}
+
+
+def test_waiting_upload_gets_the_overlap_conflict(pipeline_runs):
+    running, conflicting = post_all("/pipeline/upload/categories", "/pipeline/upload/all?wait=true")
+
+    assert running.status_code == 202
+    assert conflicting.status_code == 409
+
+
+def test_waiting_upload_gets_the_queue_limit(pipeline_runs):
+    responses = post_all(
+        "/pipeline/upload/categories",
+        "/pipeline/upload/countries",
+        "/pipeline/upload/products?wait=true"
+    )
+
+    assert [response.status_code for response in responses] == [202, 202, 429]
@@ -0,0 +1,165 @@
+import pandas as pd
+import pytest
+
+from src.models.Categories import Category
+from src.pipelines.DataIngestion import DataIngestion
+
+
+class FakeDB:
+    """
+    Stand-in for MySQLConnector keeping every table as a dict of id -> name and
+    recording the calls that change the tables, in order.
+    """
+
+    def __init__(self, saved: dict = None):
+        self.tables = {"categories": dict(saved or {})}
+        self.calls = []
+        self.watermarks = {}
+        self.fail_loads = False
+
+    def connect(self):
+        pass
+
+    def ensure_schema(self, path):
+        pass
+
+    def query_select(self, query, params=None):
+        return []
+
+    def query_prepared(self, query, params=None):
+        return []
+
+    def create_staging_table(self, table):
+        staging = f"{table}__staging"
+        self.tables[staging] = {}
+        self.calls.append(("create", staging))
+        return staging
+
+    def drop_table(self, table):
+        self.tables.pop(table, None)
+        self.calls.append(("drop", table))
+
+    def swap_table(self, table, staging):
+        self.tables[table], self.tables[staging] = self.tables[staging], self.tables[table]
+        self.calls.append(("swap", table))
+
+    def merge_table(self, table, staging, columns):
+        self.tables[table].update(self.tables[staging])
+        self.calls.append(("merge", table, tuple(columns)))
+
+    def insert_many(self, table, data, batch_size=1000, strict=False):
+        if self.fail_loads:
+            raise RuntimeError("load failed")
+        self.tables[table].update(zip(data["category_id"].tolist(), data["category_name"].tolist()))
+        self.calls.append(("insert", table, len(data)))
+
+    def get_watermark(self, table):
+        return self.watermarks.get(table)
+
+    def save_watermark(self, table, source, byte_offset, max_id, head_sha256):
+        self.watermarks[table] = {
+            "source": source, "byte_offset": byte_offset, "max_id": max_id, "head_sha256": head_sha256
+        }
+
+
+def write_categories(path, rows: list, mode: str = "w") -> None:
+    with open(path, mode, encoding="utf-8") as file:
+        if mode == "w":
+            file.write("CategoryID,CategoryName\n")
+        file.writelines(f"{category_id},{name}\n" for category_id, name in rows)
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "categories.csv"
+    write_categories(path, [(1, "Confections"), (2, "Shell fish")])
+    return path
+
+
+def ingestion(monkeypatch, db: FakeDB, source, strategy: str) -> DataIngestion:
+    monkeypatch.setenv("LOAD_STRATEGY", strategy)
+    monkeypatch.setenv("BULK_LOAD_MODE", "insert")
+    monkeypatch.setenv("INGESTION_CHUNKSIZE", "0")
+    monkeypatch.setenv("CSV_WORKERS", "1")
+    data_ingestion = DataIngestion(model_class=Category, loader_type="csv", database=db)
+    monkeypatch.setattr(data_ingestion, "generate_externaldata_path", lambda: str(source))
+    return data_ingestion
+
+
+def test_refresh_loads_into_staging_and_swaps_it_in(monkeypatch, source):
+    db = FakeDB(saved={1: "old", 9: "removed"})
+
+    stats = ingestion(monkeypatch, db, source, "refresh").upload_data()
+
+    assert db.tables == {"categories": {1: "confections", 2: "shell fish"}}
+    assert db.calls == [
+        ("create", "categories__staging"),
+        ("insert", "categories__staging", 2),
+        ("swap", "categories"),
+        ("drop", "categories__staging")
+    ]
+    assert stats["rows_loaded"] == 2
+
+
+def test_refresh_keeps_the_table_when_the_load_fails(monkeypatch, source):
+    db = FakeDB(saved={1: "old"})
+    db.fail_loads = True
+
+    with pytest.raises(RuntimeError):
+        ingestion(monkeypatch, db, source, "refresh").upload_data()
+
+    assert db.tables == {"categories": {1: "old"}}
+    assert db.calls == [("create", "categories__staging"), ("drop", "categories__staging")]
+
+
+def test_upsert_merges_the_staged_rows(monkeypatch, source):
+    db = FakeDB(saved={1: "old", 9: "kept"})
+
+    ingestion(monkeypatch, db, source, "upsert").upload_data()
+
+    assert db.tables == {"categories": {1: "confections", 2: "shell fish", 9: "kept"}}
+    assert ("merge", "categories", ("category_id", "category_name")) in db.calls
+    assert db.calls[-1] == ("drop", "categories__staging")
+
+
+def test_incremental_resumes_from_the_saved_offset(monkeypatch, source):
+    db = FakeDB()
+    ingestion(monkeypatch, db, source, "incremental").upload_data()
+    first = db.watermarks["categories"]
+
+    assert first["byte_offset"] == source.stat().st_size
+    assert first["max_id"] == 2
+
+    write_categories(source, [(3, "Dairy")], mode="a")
+    stats = ingestion(monkeypatch, db, source, "incremental").upload_data()
+
+    assert stats["rows_loaded"] == 1
+    assert db.calls[-1] == ("insert", "categories", 1)
+    assert db.tables["categories"] == {1: "confections", 2: "shell fish", 3: "dairy"}
+    assert db.watermarks["categories"]["byte_offset"] == source.stat().st_size
+    assert db.watermarks["categories"]["max_id"] == 3
+
+
+def test_incremental_rerun_without_appends_loads_nothing(monkeypatch, source):
+    db = FakeDB()
+    ingestion(monkeypatch, db, source, "incremental").upload_data()
+    watermark = dict(db.watermarks["categories"])
+    calls = len(db.calls)
+
+    stats = ingestion(monkeypatch, db, source, "incremental").upload_data()
+
+    assert stats["rows_loaded"] == 0
+    assert len(db.calls) == calls
+    assert db.watermarks["categories"] == watermark
+
+
+def test_incremental_reloads_a_file_whose_head_was_rewritten(monkeypatch, source):
+    db = FakeDB()
+    ingestion(monkeypatch, db, source, "incremental").upload_data()
+
+    write_categories(source, [(1, "Confectionz"), (2, "Shell fish"), (3, "Dairy")])
+    stats = ingestion(monkeypatch, db, source, "incremental").upload_data()
+
+    assert stats["rows_loaded"] == 3
+    assert db.tables["categories"][1] == "confectionz"
+    assert db.watermarks["categories"]["byte_offset"] == source.stat().st_size
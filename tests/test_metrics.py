@@ -0,0 +1,45 @@
+import time
+
+import pandas as pd
+import pytest
+
+from src.database.DataBase__singleton import DB_CALL_ROWS, DB_CALL_SECONDS, instrumented
+from src.monitoring.Metrics import Metric
+
+
+def test_metric_base_is_abstract():
+    with pytest.raises(TypeError):
+        Metric("base_metric", "A metric without samples")
+
+
+def rows_counted(method_name: str) -> float:
+    return DB_CALL_ROWS._values.get((method_name,), 0)
+
+
+def test_instrumented_counts_rows_of_positional_data():
+    @instrumented
+    def load_rows_for_test(self, table, data, strict=False):
+        return None
+
+    data = pd.DataFrame({"id": range(5)})
+    load_rows_for_test(None, "sales", data)
+    load_rows_for_test(None, table="sales", data=data)
+
+    assert rows_counted("load_rows_for_test") == 10
+
+
+def test_instrumented_times_the_consumption_of_a_generator():
+    @instrumented
+    def stream_frames_for_test(self, chunks):
+        for rows in range(chunks):
+            time.sleep(0.05)
+            yield pd.DataFrame({"id": range(rows + 1)})
+
+    frames = stream_frames_for_test(None, 3)
+
+    assert ("stream_frames_for_test",) not in DB_CALL_SECONDS._values
+    assert [len(frame) for frame in frames] == [1, 2, 3]
+    counts, total = DB_CALL_SECONDS._values[("stream_frames_for_test",)]
+    assert sum(counts) == 1
+    assert total >= 0.15
+    assert rows_counted("stream_frames_for_test") == 6
@@ -0,0 +1,50 @@
+import pandas as pd
+import pytest
+
+from src.factory.ProcessPool import ProcessPool
+from src.factory.concrete.loader.CSVLoader import CSVLoader
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(ProcessPool, "_instance", None)
+    monkeypatch.delenv("CSV_WORKERS", raising=False)
+    monkeypatch.delenv("VALIDATION_WORKERS", raising=False)
+    process_pool = ProcessPool()
+    yield process_pool
+    process_pool.shutdown()
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "sales.csv"
+    pd.DataFrame({"SalesID": range(4000), "Quantity": range(4000)}).to_csv(path, index=False)
+    return str(path)
+
+
+def test_larger_lease_does_not_break_a_running_parallel_load(pool, csv_file):
+    loader = CSVLoader(csv_file, chunksize=500, workers=2)
+    chunks = loader.load_chunks()
+    rows = len(next(chunks))
+
+    # the validation of the first chunk asks for a bigger pool while the load is still reading
+    with pool.lease(workers=4) as executor:
+        assert executor.submit(abs, -1).result() == 1
+    rows += sum(len(chunk) for chunk in chunks)
+
+    assert rows == 4000
+    assert pool.workers == 4
+    assert len(pool._holders) == 1
+
+
+def test_pool_starts_with_the_configured_workers(monkeypatch):
+    monkeypatch.setattr(ProcessPool, "_instance", None)
+    monkeypatch.setenv("CSV_WORKERS", "2")
+    monkeypatch.setenv("VALIDATION_WORKERS", "3")
+    process_pool = ProcessPool()
+    try:
+        with process_pool.lease(workers=2) as first, process_pool.lease(workers=3) as second:
+            assert first is second
+        assert process_pool.workers == 3
+    finally:
+        process_pool.shutdown()
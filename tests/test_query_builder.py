@@ -0,0 +1,30 @@
+import pytest
+
+from src.database.QueryBuilder import CRUDQueryBuilder
+
+
+def test_get_statement_returns_placeholders_and_params():
+    builder = CRUDQueryBuilder("sales", filters=[("Quantity", "BETWEEN", (1, 5)), ("ProductID", "IN", [3, 4])])
+
+    assert builder.get_statement() == (
+        "SELECT * FROM sales WHERE Quantity BETWEEN %s AND %s AND ProductID IN (%s, %s);",
+        (1, 5, 3, 4)
+    )
+
+
+def test_get_query_without_values_keeps_working():
+    builder = CRUDQueryBuilder("sales", aggregates=["COUNT(*) AS total"])
+
+    assert builder.get_query() == "SELECT COUNT(*) AS total FROM sales;"
+
+
+def test_get_query_with_values_points_to_get_statement():
+    builder = CRUDQueryBuilder("categories", query_type="CREATE", values={"CategoryName": "Snacks"})
+
+    with pytest.raises(ValueError, match="get_statement"):
+        builder.get_query()
+
+
+def test_identifiers_are_validated():
+    with pytest.raises(ValueError):
+        CRUDQueryBuilder("sales; DROP TABLE sales")